@@ -7,51 +7,168 @@ different blog platforms while respecting robots.txt and rate limiting.
 
 import asyncio
 import logging
+import multiprocessing
 import re
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import soupsieve
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bs4.dammit import EncodingDetector, UnicodeDammit
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from backend.shared.config import crawling_settings, settings
+from backend.shared.config import crawling_settings, get_settings
 from backend.shared.models import CrawlResult
 
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml tree builder; fall back to the stdlib parser
+try:
+    from lxml import etree
+    HTML_PARSER = "lxml"
+except ImportError:
+    etree = None
+    HTML_PARSER = "html.parser"
+
+# selectolax (lexbor) gives a C-level DOM for the known platforms
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:
+    LexborHTMLParser = None
+
+# ada-url resolves relative links in C++, well ahead of urljoin
+try:
+    from ada_url import join_url
+except ImportError:
+    join_url = None
+
+HTTP_SCHEMES = ("http://", "https://")
+
+# Dates such as "2024-01-02", "2024.1.2", "2024. 1. 2." or "2024-01-02T03:04:05Z"
+DATE_RE = re.compile(
+    r"(\d{4})[-./]\s*(\d{1,2})[-./]\s*(\d{1,2})\.?"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?)?"
+)
+
+# Selector list entries made of a tag, a class or tag.class only
+SIMPLE_SELECTOR_RE = re.compile(r"([a-zA-Z][\w-]*)?(?:\.([\w-]+))?$")
+
+
+def parse_simple_selector(selector: str) -> Optional[List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Split a selector list into (tag, class) rules.
+    
+    Args:
+        selector: CSS selector list such as "h1.entry-title, .post"
+        
+    Returns:
+        One (tag, class) rule per entry, or None if any entry uses more
+        than a tag and a single class
+    """
+    rules = []
+    for part in selector.split(","):
+        match = SIMPLE_SELECTOR_RE.match(part.strip())
+        if not match or not any(match.groups()):
+            return None
+        tag, css_class = match.groups()
+        rules.append((tag.lower() if tag else None, css_class))
+    
+    return rules
+
+
+def decode_markup(
+    html: Union[str, bytes], declaration_window: Optional[int] = None
+) -> Union[str, bytes]:
+    """
+    Prepare page bytes for a parser that only trusts what the markup declares.
+    
+    lxml and lexbor read undeclared bytes as latin-1 or UTF-8. Bytes they
+    can decode themselves (ASCII, a BOM, or a charset declaration within
+    the parser's reach) are passed through; anything else is decoded here,
+    once, as UTF-8 or with BeautifulSoup's guess for pages such as EUC-KR
+    served without a charset.
+    
+    Args:
+        html: Raw HTML of the page, as text or undecoded bytes
+        declaration_window: Bytes the parser scans for a charset declaration;
+            None for BeautifulSoup's own window
+        
+    Returns:
+        The bytes unchanged, or the decoded text
+    """
+    if isinstance(html, str) or html.isascii():
+        return html
+    
+    if EncodingDetector.strip_byte_order_mark(html)[1] is not None:
+        return html
+    
+    head = html if declaration_window is None else html[:declaration_window]
+    if EncodingDetector.find_declared_encoding(head, is_html=True) is not None:
+        return html
+    
+    try:
+        return html.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    
+    text = UnicodeDammit(html, is_html=True).unicode_markup
+    return text if text is not None else html.decode("utf-8", errors="replace")
+
+
+def resolve_url(base_url: str, href: str) -> str:
+    """
+    Resolve a link against the page URL, preferring ada-url when installed.
+    
+    Hrefs ada-url rejects go through urljoin, which raises ValueError for
+    ones it cannot parse either, such as "//[bad".
+    """
+    if join_url is not None:
+        try:
+            return join_url(base_url, href)
+        except ValueError:
+            pass
+    
+    return urljoin(base_url, href)
+
 
 class PlatformDetector:
     """Detects blog platform from URL."""
     
-    PLATFORM_PATTERNS = {
-        "naver": [
-            r"blog\.naver\.com",
-            r"m\.blog\.naver\.com"
-        ],
-        "tistory": [
-            r"\.tistory\.com",
-            r"tistory\.com"
-        ],
-        "wordpress": [
-            r"wordpress\.com",
-            r"wp\.com",
-            r"/wp-content/",
-            r"/wp-includes/"
-        ],
-        "medium": [
-            r"medium\.com",
-            r"\.medium\.com"
-        ],
-        "brunch": [
-            r"brunch\.co\.kr"
-        ]
+    # Hostname suffixes, matched against the dot-prefixed hostname so that
+    # "tistory.com" covers "foo.tistory.com" but not "nottistory.com"
+    PLATFORM_HOSTS = {
+        "naver": ("blog.naver.com",),
+        "tistory": ("tistory.com",),
+        "wordpress": ("wordpress.com", "wp.com"),
+        "medium": ("medium.com",),
+        "brunch": ("brunch.co.kr",)
+    }
+    
+    # Path markers for self-hosted platforms
+    PLATFORM_PATHS = {
+        "wordpress": ("/wp-content/", "/wp-includes/")
     }
     
+    _HOST_SUFFIXES = [
+        (platform, tuple("." + host for host in hosts))
+        for platform, hosts in PLATFORM_HOSTS.items()
+    ]
+    
     @classmethod
     def detect_platform(cls, url: str) -> Optional[str]:
         """
@@ -63,12 +180,17 @@ class PlatformDetector:
         Returns:
             Platform name or None if not detected
         """
-        url_lower = url.lower()
+        parsed = urlparse(url)
+        hostname = "." + (parsed.hostname or "")
+        
+        for platform, suffixes in cls._HOST_SUFFIXES:
+            if hostname.endswith(suffixes):
+                return platform
         
-        for platform, patterns in cls.PLATFORM_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, url_lower):
-                    return platform
+        path_lower = parsed.path.lower()
+        for platform, markers in cls.PLATFORM_PATHS.items():
+            if any(marker in path_lower for marker in markers):
+                return platform
         
         return None
 
@@ -79,40 +201,89 @@ class RateLimiter:
     def __init__(self):
         self.last_requests: Dict[str, float] = {}
         self.request_counts: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.default_delay = get_settings().REQUEST_DELAY
+        # Per-platform delay column of RATE_LIMITS, read on every request
+        self.platform_delays: Dict[str, float] = {
+            platform: limits["delay"]
+            for platform, limits in crawling_settings.RATE_LIMITS.items()
+        }
     
     async def wait_if_needed(self, domain: str, platform: Optional[str] = None) -> None:
         """
         Wait if necessary to respect rate limits.
         
+        Requests to the same domain are serialized through a per-domain lock,
+        so concurrent coroutines cannot read the same timestamp and skip the
+        delay. Different domains do not block each other.
+        
         Args:
             domain: Domain to rate limit
             platform: Platform type for specific limits
         """
-        now = time.time()
-        
         # Get platform-specific or default delay
-        if platform and platform in crawling_settings.RATE_LIMITS:
-            delay = crawling_settings.RATE_LIMITS[platform]["delay"]
-        else:
-            delay = settings.REQUEST_DELAY
-        
-        # Check if we need to wait
-        if domain in self.last_requests:
-            time_since_last = now - self.last_requests[domain]
-            if time_since_last < delay:
-                wait_time = delay - time_since_last
-                logger.info(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                await asyncio.sleep(wait_time)
+        delay = self.platform_delays.get(platform, self.default_delay)
         
-        self.last_requests[domain] = time.time()
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            # Check if we need to wait
+            if domain in self.last_requests:
+                time_since_last = time.monotonic() - self.last_requests[domain]
+                if time_since_last < delay:
+                    wait_time = delay - time_since_last
+                    logger.info(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+                    await asyncio.sleep(wait_time)
+            
+            self.last_requests[domain] = time.monotonic()
+
+
+class _ExtractionPlan(NamedTuple):
+    """Per-platform selectors, specialized once and shared by all extractors."""
+    
+    selectors: Dict[str, str]
+    matchers: List[Tuple[str, Callable[[Tag], bool]]]
+
+
+def _rule_matcher(rules: List[Tuple[Optional[str], Optional[str]]]) -> Callable[[Tag], bool]:
+    """Build a plain predicate for (tag, class) rules, skipping the CSS engine."""
+    def match(elem: Tag) -> bool:
+        classes = None
+        for tag, css_class in rules:
+            if tag is not None and tag != elem.name:
+                continue
+            if css_class is None:
+                return True
+            if classes is None:
+                classes = elem.get("class") or ()
+            if css_class in classes:
+                return True
+        return False
+    
+    return match
 
 
 class ContentExtractor:
     """Extracts content from different blog platforms."""
     
+    # Fields located through the platform CSS selectors
+    SELECTOR_FIELDS = ("title", "content", "author", "date")
+    
+    # <meta name="..."> values used as fallbacks
+    META_NAMES = frozenset({"description", "keywords", "author", "date"})
+    
+    # Subtrees left out of the main content text
+    CONTENT_SKIP_TAGS = frozenset({"script", "style", "nav", "footer"})
+    
+    # Specialized extraction plan per platform, shared by all instances
+    _plan_cache: Dict[Optional[str], _ExtractionPlan] = {}
+    
     def __init__(self, platform: Optional[str] = None):
         self.platform = platform
-        self.selectors = self._get_selectors()
+        
+        plan = self._plan_cache.get(platform)
+        if plan is None:
+            plan = self._plan_cache[platform] = self._build_plan()
+        self.selectors, self._matchers = plan
     
     def _get_selectors(self) -> Dict[str, str]:
         """Get platform-specific CSS selectors."""
@@ -128,10 +299,45 @@ class ContentExtractor:
             "date": ".date, .published, time"
         }
     
+    def _build_plan(self) -> _ExtractionPlan:
+        """
+        Specialize the platform selectors for the document walk.
+        
+        Selector lists made only of tags and classes become plain predicates;
+        anything else is matched by the compiled soupsieve selector.
+        """
+        selectors = self._get_selectors()
+        matchers = []
+        for field in self.SELECTOR_FIELDS:
+            rules = parse_simple_selector(selectors[field])
+            if rules is not None:
+                matchers.append((field, _rule_matcher(rules)))
+            else:
+                matchers.append((field, soupsieve.compile(selectors[field]).match))
+        
+        return _ExtractionPlan(selectors, matchers)
+    
+    def extract_html(self, html: Union[str, bytes], url: str) -> Dict[str, Optional[str]]:
+        """
+        Parse raw HTML and extract content from it.
+        
+        Args:
+            html: Raw HTML of the page, as text or undecoded bytes
+            url: Original URL for context
+            
+        Returns:
+            Dictionary with extracted content
+        """
+        soup = BeautifulSoup(html, HTML_PARSER)
+        return self.extract_content(soup, url)
+    
     def extract_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Optional[str]]:
         """
         Extract content from parsed HTML.
         
+        Every field is collected during a single walk over the document
+        rather than one tree search per field.
+        
         Args:
             soup: BeautifulSoup parsed HTML
             url: Original URL for context
@@ -139,152 +345,539 @@ class ContentExtractor:
         Returns:
             Dictionary with extracted content
         """
-        result = {
-            "title": self._extract_title(soup),
-            "content": self._extract_content(soup),
-            "meta_description": self._extract_meta_description(soup),
-            "meta_keywords": self._extract_meta_keywords(soup),
-            "author": self._extract_author(soup),
-            "published_date": self._extract_date(soup),
-            "links": self._extract_links(soup, url),
-            "images": self._extract_images(soup, url)
+        matches: Dict[str, Tag] = {}
+        pending = self._matchers
+        meta: Dict[str, Optional[str]] = {}
+        html_title: Optional[Tag] = None
+        links: Dict[str, None] = {}
+        images: Dict[str, None] = {}
+        
+        for elem in soup.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            
+            name = elem.name
+            if name == "meta":
+                meta_name = elem.get("name")
+                if meta_name in self.META_NAMES:
+                    meta.setdefault(meta_name, elem.get("content"))
+                elif elem.get("property") == "og:description":
+                    meta.setdefault("og:description", elem.get("content"))
+            elif name == "a":
+                self._add_url(links, elem.get("href"), url)
+            elif name == "img":
+                self._add_url(images, elem.get("src"), url)
+            elif name == "title" and html_title is None:
+                html_title = elem
+            
+            # First element in document order wins, as with select_one
+            if pending:
+                matched = False
+                for field, match in pending:
+                    if match(elem):
+                        matches[field] = elem
+                        matched = True
+                if matched:
+                    pending = [item for item in pending if item[0] not in matches]
+        
+        title_elem = matches.get("title") or html_title
+        author_elem = matches.get("author")
+        date_elem = matches.get("date")
+        
+        if date_elem is not None:
+            date_str = date_elem.get("datetime") or date_elem.get_text(strip=True)
+        else:
+            date_str = meta.get("date")
+        
+        return {
+            "title": title_elem.get_text(strip=True) if title_elem is not None else None,
+            "content": self._get_content_text(matches.get("content")),
+            "meta_description": meta.get("description") or meta.get("og:description"),
+            "meta_keywords": meta.get("keywords"),
+            "author": (
+                author_elem.get_text(strip=True) if author_elem is not None
+                else meta.get("author")
+            ),
+            "published_date": self._parse_date(date_str),
+            "links": tuple(links),
+            "images": tuple(images)
         }
+    
+    @staticmethod
+    def _add_url(seen: Dict[str, None], value: Optional[str], base_url: str) -> None:
+        """Add an absolute or root-relative URL to the ordered, de-duplicating dict."""
+        if not value:
+            return
         
-        return result
+        # Branch on the first character so most hrefs need a single check
+        first = value[0]
+        if first == "h":
+            if value.startswith(HTTP_SCHEMES):
+                seen[value] = None
+        elif first == "/":
+            try:
+                seen[resolve_url(base_url, value)] = None
+            except ValueError:
+                logger.debug(f"Skipping malformed URL: {value}")
     
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract page title."""
-        # Try platform-specific selector first
-        title_elem = soup.select_one(self.selectors["title"])
-        if title_elem:
-            return title_elem.get_text(strip=True)
+    def _get_content_text(self, content_elem: Optional[Tag]) -> Optional[str]:
+        """
+        Get the text of the main content element.
         
-        # Fallback to HTML title
-        title_elem = soup.find("title")
-        if title_elem:
-            return title_elem.get_text(strip=True)
+        Skipped subtrees are stepped over during the walk instead of being
+        removed from the tree first.
+        """
+        if content_elem is None:
+            return None
         
-        return None
+        parts = []
+        stack = [iter(content_elem.contents)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, Tag):
+                    if child.name not in self.CONTENT_SKIP_TAGS:
+                        stack.append(iter(child.contents))
+                        break
+                elif type(child) is NavigableString or type(child) is CData:
+                    text = child.strip()
+                    if text:
+                        parts.append(text)
+            else:
+                stack.pop()
+        
+        return "\n".join(parts)
     
-    def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract main content."""
-        content_elem = soup.select_one(self.selectors["content"])
-        if content_elem:
-            # Remove script and style elements
-            for script in content_elem(["script", "style", "nav", "footer"]):
-                script.decompose()
-            
-            return content_elem.get_text(separator="\n", strip=True)
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        """Parse date string to datetime."""
+        if not date_str:
+            return None
+        
+        match = DATE_RE.match(date_str.strip())
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            try:
+                return datetime(
+                    int(year), int(month), int(day),
+                    int(hour or 0), int(minute or 0), int(second or 0)
+                )
+            except ValueError:
+                pass
         
+        logger.warning(f"Could not parse date: {date_str}")
         return None
+
+
+class ContentExtractorFast(ContentExtractor):
+    """
+    Extracts content using selectolax's lexbor DOM and CSS engine.
     
-    def _extract_meta_description(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract meta description."""
-        meta_elem = soup.find("meta", attrs={"name": "description"})
-        if meta_elem:
-            return meta_elem.get("content")
+    Only used for the known blog platforms; pages from unknown sites keep the
+    BeautifulSoup path, which copes better with pathological markup.
+    
+    lexbor builds the tree a browser would, so on misnested markup the
+    content text can be split or ordered differently from the lxml-based
+    extractors.
+    """
+    
+    # Text inside these tags never counts towards element text
+    HIDDEN_TAGS = frozenset({"script", "style", "template"})
+    
+    # lexbor only honours a charset declared within the first 1024 bytes
+    DECLARATION_WINDOW = 1024
+    
+    @classmethod
+    def supports(cls, platform: Optional[str]) -> bool:
+        """Check whether the fast path can handle the given platform."""
+        return (
+            LexborHTMLParser is not None
+            and platform in crawling_settings.PLATFORM_SELECTORS
+        )
+    
+    def extract_html(self, html: Union[str, bytes], url: str) -> Dict[str, Optional[str]]:
+        """
+        Parse raw HTML and extract content from it.
         
-        # Try Open Graph description
-        og_elem = soup.find("meta", attrs={"property": "og:description"})
-        if og_elem:
-            return og_elem.get("content")
+        Args:
+            html: Raw HTML of the page, as text or undecoded bytes
+            url: Original URL for context
+            
+        Returns:
+            Dictionary with extracted content
+        """
+        markup = decode_markup(html, self.DECLARATION_WINDOW)
+        tree = LexborHTMLParser(markup, encoding=True)
         
-        return None
+        meta: Dict[str, Optional[str]] = {}
+        for node in tree.css("meta"):
+            attrs = node.attributes
+            meta_name = attrs.get("name")
+            if meta_name in self.META_NAMES:
+                meta.setdefault(meta_name, attrs.get("content"))
+            elif attrs.get("property") == "og:description":
+                meta.setdefault("og:description", attrs.get("content"))
+        
+        links: Dict[str, None] = {}
+        for node in tree.css("a[href]"):
+            self._add_url(links, node.attributes.get("href"), url)
+        
+        images: Dict[str, None] = {}
+        for node in tree.css("img[src]"):
+            self._add_url(images, node.attributes.get("src"), url)
+        
+        title_node = tree.css_first(self.selectors["title"]) or tree.css_first("title")
+        author_node = tree.css_first(self.selectors["author"])
+        date_node = tree.css_first(self.selectors["date"])
+        content_node = tree.css_first(self.selectors["content"])
+        
+        if date_node is not None:
+            date_str = date_node.attributes.get("datetime") or self._node_text(date_node)
+        else:
+            date_str = meta.get("date")
+        
+        return {
+            "title": self._node_text(title_node) if title_node is not None else None,
+            "content": (
+                self._node_text(content_node, self.CONTENT_SKIP_TAGS, "\n")
+                if content_node is not None else None
+            ),
+            "meta_description": meta.get("description") or meta.get("og:description"),
+            "meta_keywords": meta.get("keywords"),
+            "author": (
+                self._node_text(author_node) if author_node is not None
+                else meta.get("author")
+            ),
+            "published_date": self._parse_date(date_str),
+            "links": tuple(links),
+            "images": tuple(images)
+        }
     
-    def _extract_meta_keywords(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract meta keywords."""
-        meta_elem = soup.find("meta", attrs={"name": "keywords"})
-        if meta_elem:
-            return meta_elem.get("content")
+    def _node_text(
+        self, node: "LexborNode", skip_tags: frozenset = frozenset(), separator: str = ""
+    ) -> str:
+        """
+        Join the stripped, non-empty text nodes of a subtree.
         
-        return None
+        Script, style and template text never counts, as with BeautifulSoup's
+        get_text; lexbor's own text() would include it.
+        
+        Args:
+            node: Subtree root
+            skip_tags: Further tags whose subtrees are left out
+            separator: String placed between text nodes
+            
+        Returns:
+            Text of the subtree
+        """
+        parts = []
+        stack = [node.child]
+        while stack:
+            child = stack.pop()
+            if child is None:
+                continue
+            
+            # Sibling goes under the first child so subtrees come out in order
+            stack.append(child.next)
+            tag = child.tag
+            if tag == "-text":
+                text = child.text_content.strip()
+                if text:
+                    parts.append(text)
+            elif tag not in self.HIDDEN_TAGS and tag not in skip_tags:
+                stack.append(child.child)
+        
+        return separator.join(parts)
+
+
+class _ExtractionTarget:
+    """
+    lxml parser target that collects extractor fields from parse events.
     
-    def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract author information."""
-        author_elem = soup.select_one(self.selectors["author"])
-        if author_elem:
-            return author_elem.get_text(strip=True)
+    No element tree is built: tags are matched against simple selectors as
+    they open, and text is only kept for the elements that matched.
+    """
+    
+    # Text inside these tags never counts towards element text
+    HIDDEN_TAGS = frozenset({"script", "style", "template"})
+    
+    # Additionally left out of the main content text
+    CONTENT_SKIP_TAGS = frozenset({"nav", "footer"})
+    
+    def __init__(self, extractor: "ContentExtractorStream", url: str):
+        self.extractor = extractor
+        self.url = url
+        self.pending = list(extractor.rules)
+        self.depth = 0
+        self.hidden = 0
+        self.skipped = 0
+        self.buffer: List[str] = []
+        # Open captures: [field, depth, text parts, skip baseline or None]
+        self.captures: List[list] = []
+        self.texts: Dict[str, List[str]] = {}
+        self.date_attr: Optional[str] = None
+        self.meta: Dict[str, Optional[str]] = {}
+        self.links: Dict[str, None] = {}
+        self.images: Dict[str, None] = {}
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        """Handle an opening tag."""
+        self._flush()
+        self.depth += 1
         
-        # Try meta author
-        meta_elem = soup.find("meta", attrs={"name": "author"})
-        if meta_elem:
-            return meta_elem.get("content")
+        if tag in self.HIDDEN_TAGS:
+            self.hidden += 1
+        elif tag in self.CONTENT_SKIP_TAGS:
+            self.skipped += 1
         
-        return None
+        if tag == "meta":
+            meta_name = attrib.get("name")
+            if meta_name in self.extractor.META_NAMES:
+                self.meta.setdefault(meta_name, attrib.get("content"))
+            elif attrib.get("property") == "og:description":
+                self.meta.setdefault("og:description", attrib.get("content"))
+        elif tag == "a":
+            self.extractor._add_url(self.links, attrib.get("href"), self.url)
+        elif tag == "img":
+            self.extractor._add_url(self.images, attrib.get("src"), self.url)
+        elif tag == "title" and "html_title" not in self.texts:
+            self._capture("html_title")
+        
+        if self.pending:
+            classes = (attrib.get("class") or "").split()
+            matched = [
+                field for field, rules in self.pending
+                if any(
+                    (rule_tag is None or rule_tag == tag)
+                    and (rule_class is None or rule_class in classes)
+                    for rule_tag, rule_class in rules
+                )
+            ]
+            if matched:
+                for field in matched:
+                    self._capture(field)
+                    if field == "date":
+                        self.date_attr = attrib.get("datetime")
+                self.pending = [item for item in self.pending if item[0] not in matched]
     
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[datetime]:
-        """Extract publication date."""
-        date_elem = soup.select_one(self.selectors["date"])
-        if date_elem:
-            date_str = date_elem.get("datetime") or date_elem.get_text(strip=True)
-            return self._parse_date(date_str)
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        self._flush()
         
-        # Try meta date
-        meta_elem = soup.find("meta", attrs={"name": "date"})
-        if meta_elem:
-            return self._parse_date(meta_elem.get("content"))
+        if self.captures:
+            self.captures = [cap for cap in self.captures if cap[1] != self.depth]
         
-        return None
+        if tag in self.HIDDEN_TAGS:
+            self.hidden -= 1
+        elif tag in self.CONTENT_SKIP_TAGS:
+            self.skipped -= 1
+        
+        self.depth -= 1
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string to datetime."""
-        if not date_str:
-            return None
+    def data(self, data: str) -> None:
+        """Buffer text; lxml may deliver one text node in several chunks."""
+        if self.captures:
+            self.buffer.append(data)
+    
+    def comment(self, text: str) -> None:
+        """Comments end the current text node."""
+        self._flush()
+    
+    def close(self) -> None:
+        """Finish parsing."""
+        self._flush()
+    
+    def _capture(self, field: str) -> None:
+        """Start collecting the text of the element that just opened."""
+        parts: List[str] = []
+        self.texts[field] = parts
+        baseline = self.skipped if field == "content" else None
+        self.captures.append([field, self.depth, parts, baseline])
+    
+    def _flush(self) -> None:
+        """Hand the buffered text node to every open capture."""
+        if not self.buffer:
+            return
         
-        # Common date formats
-        formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y.%m.%d",
-            "%Y/%m/%d"
-        ]
+        text = "".join(self.buffer).strip()
+        self.buffer.clear()
+        if not text or self.hidden:
+            return
         
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str[:len(fmt)], fmt)
-            except ValueError:
-                continue
+        for _, _, parts, baseline in self.captures:
+            if baseline is None or self.skipped <= baseline:
+                parts.append(text)
+
+
+class ContentExtractorStream(ContentExtractor):
+    """
+    Extracts content from lxml parse events without building a tree.
+    
+    Works when every selector is a plain tag, class or tag.class list, which
+    holds for the generic selectors used on unknown sites. Other selectors,
+    and documents lxml cannot handle, go through the BeautifulSoup path.
+    """
+    
+    # Compiled (tag, class) rules per platform, or None if not expressible
+    _rules_cache: Dict[
+        Optional[str], Optional[List[Tuple[str, List[Tuple[Optional[str], Optional[str]]]]]]
+    ] = {}
+    
+    def __init__(self, platform: Optional[str] = None):
+        super().__init__(platform)
         
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
+        if platform not in self._rules_cache:
+            self._rules_cache[platform] = self._compile_rules()
+        self.rules = self._rules_cache[platform]
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract all links from the page."""
-        links = []
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if href.startswith(("http://", "https://")):
-                links.append(href)
-            elif href.startswith("/"):
-                links.append(urljoin(base_url, href))
+    def _compile_rules(
+        self
+    ) -> Optional[List[Tuple[str, List[Tuple[Optional[str], Optional[str]]]]]]:
+        """Turn the selectors into (tag, class) rules, if they are simple enough."""
+        compiled = []
+        for field in self.SELECTOR_FIELDS:
+            rules = parse_simple_selector(self.selectors[field])
+            if rules is None:
+                return None
+            compiled.append((field, rules))
         
-        return list(set(links))  # Remove duplicates
+        return compiled
     
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract all images from the page."""
-        images = []
-        for img in soup.find_all("img", src=True):
-            src = img["src"]
-            if src.startswith(("http://", "https://")):
-                images.append(src)
-            elif src.startswith("/"):
-                images.append(urljoin(base_url, src))
+    def extract_html(self, html: Union[str, bytes], url: str) -> Dict[str, Optional[str]]:
+        """
+        Parse raw HTML and extract content from it.
         
-        return list(set(images))  # Remove duplicates
+        Args:
+            html: Raw HTML of the page, as text or undecoded bytes
+            url: Original URL for context
+            
+        Returns:
+            Dictionary with extracted content
+        """
+        if self.rules is None:
+            return super().extract_html(html, url)
+        
+        target = _ExtractionTarget(self, url)
+        try:
+            etree.fromstring(decode_markup(html), etree.HTMLParser(target=target))
+        except (etree.LxmlError, ValueError) as e:
+            logger.debug(f"Streaming parse failed for {url}, using BeautifulSoup: {e}")
+            return super().extract_html(html, url)
+        
+        texts = target.texts
+        meta = target.meta
+        
+        title = texts.get("title", texts.get("html_title"))
+        content = texts.get("content")
+        author = texts.get("author")
+        
+        if "date" in texts:
+            date_str = target.date_attr or "".join(texts["date"])
+        else:
+            date_str = meta.get("date")
+        
+        return {
+            "title": "".join(title) if title is not None else None,
+            "content": "\n".join(content) if content is not None else None,
+            "meta_description": meta.get("description") or meta.get("og:description"),
+            "meta_keywords": meta.get("keywords"),
+            "author": "".join(author) if author is not None else meta.get("author"),
+            "published_date": self._parse_date(date_str),
+            "links": tuple(target.links),
+            "images": tuple(target.images)
+        }
+
+
+def create_extractor(platform: Optional[str]) -> ContentExtractor:
+    """Pick the fastest extractor available for the platform."""
+    if ContentExtractorFast.supports(platform):
+        return ContentExtractorFast(platform)
+    
+    if etree is not None:
+        return ContentExtractorStream(platform)
+    
+    return ContentExtractor(platform)
+
+
+def _parse_and_extract(
+    html: Union[str, bytes], url: str, platform: Optional[str]
+) -> Dict[str, Optional[str]]:
+    """Parse and extract a page. Top level so parser worker processes can run it."""
+    return create_extractor(platform).extract_html(html, url)
+
+
+# Workers start from a clean process, not a fork of one running asyncio and
+# Playwright threads
+_PARSE_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Parser worker processes shared by every crawler, started on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared parser worker pool, starting it if needed."""
+    global _parse_pool
+    
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=get_settings().PARSER_WORKERS,
+                mp_context=_PARSE_POOL_CONTEXT
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next parse starts a fresh one."""
+    global _parse_pool
+    
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the shared parser workers, e.g. from a service's shutdown hook."""
+    global _parse_pool
+    
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 class BlogCrawler:
     """Main crawler class for blog content extraction."""
     
+    # Platforms that heavily use JavaScript and lazy-load their content
+    BROWSER_PLATFORMS = {"naver", "medium"}
+    
+    # Crawls in flight before parsing moves to the worker pool; below this,
+    # shipping a page to a worker costs more than parsing it here
+    PARSE_POOL_MIN_CRAWLS = 3
+    
     def __init__(self):
         self.rate_limiter = RateLimiter()
         self.session: Optional[aiohttp.ClientSession] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
+        # Fixed number of slots; None marks a slot whose context is made on borrow
+        self._context_pool: "asyncio.Queue[Optional[BrowserContext]]" = asyncio.Queue()
+        self._parser_workers = get_settings().PARSER_WORKERS
+        self._active_crawls = 0
     
     async def __aenter__(self):
         """Async context manager entry."""
-        connector = aiohttp.TCPConnector(limit=settings.CONCURRENT_REQUESTS)
+        settings = get_settings()
+        connector = aiohttp.TCPConnector(
+            limit=settings.CONCURRENT_REQUESTS,
+            limit_per_host=settings.CONCURRENT_REQUESTS_PER_DOMAIN,
+            ttl_dns_cache=settings.DNS_CACHE_TTL,
+            enable_cleanup_closed=True
+        )
         timeout = aiohttp.ClientTimeout(total=settings.DOWNLOAD_TIMEOUT)
         
         self.session = aiohttp.ClientSession(
@@ -298,6 +891,16 @@ class BlogCrawler:
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        
+        if self._browser:
+            # Closing the browser also closes every pooled context
+            await self._browser.close()
+            self._browser = None
+            self._context_pool = asyncio.Queue()
+        
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
     
     async def crawl_url(self, url: str, use_browser: bool = False) -> CrawlResult:
         """
@@ -311,6 +914,7 @@ class BlogCrawler:
             CrawlResult with extracted data
         """
         start_time = time.time()
+        self._active_crawls += 1
         
         try:
             # Detect platform
@@ -321,16 +925,20 @@ class BlogCrawler:
             domain = urlparse(url).netloc
             await self.rate_limiter.wait_if_needed(domain, platform)
             
+            extractor = create_extractor(platform)
+            
             # Choose crawling method
             if use_browser or self._needs_browser(platform):
-                html_content, status_code = await self._crawl_with_browser(url)
+                html_content, status_code = await self._crawl_with_browser(
+                    url,
+                    wait_selector=extractor.selectors["content"],
+                    scroll=platform in self.BROWSER_PLATFORMS
+                )
             else:
                 html_content, status_code = await self._crawl_with_http(url)
             
             # Parse content
-            soup = BeautifulSoup(html_content, "html.parser")
-            extractor = ContentExtractor(platform)
-            content_data = extractor.extract_content(soup, url)
+            content_data = await self._parse(extractor, html_content, url, platform)
             
             response_time = time.time() - start_time
             
@@ -353,38 +961,92 @@ class BlogCrawler:
                 error_message=str(e),
                 response_time=response_time
             )
+        
+        finally:
+            self._active_crawls -= 1
     
-    async def _crawl_with_http(self, url: str) -> tuple[str, int]:
-        """Crawl URL using HTTP client."""
+    async def _parse(
+        self,
+        extractor: ContentExtractor,
+        html: Union[str, bytes],
+        url: str,
+        platform: Optional[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract a page, in the shared worker pool when many crawls are in flight.
+        
+        A lone crawl parses inline. If the pool's workers died, the pool is
+        replaced for the next crawl and this page is parsed inline.
+        """
+        if self._parser_workers < 1 or self._active_crawls < self.PARSE_POOL_MIN_CRAWLS:
+            return extractor.extract_html(html, url)
+        
+        pool = _get_parse_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _parse_and_extract, html, url, platform
+            )
+        except BrokenProcessPool:
+            logger.warning("Parser worker pool broke; starting a new one")
+            _discard_parse_pool(pool)
+            return extractor.extract_html(html, url)
+    
+    async def _crawl_with_http(self, url: str) -> tuple[Union[str, bytes], int]:
+        """
+        Crawl URL using HTTP client.
+        
+        The body is returned as raw bytes so the parser can detect the encoding
+        itself, instead of aiohttp decoding it first. Only a non-UTF-8 charset
+        declared in the response headers is decoded here, since parsers only
+        look for one in the markup.
+        """
         if not self.session:
             raise RuntimeError("Session not initialized. Use async context manager.")
         
         async with self.session.get(url) as response:
             status_code = response.status
-            html_content = await response.text()
+            body = await response.read()
             
             if status_code >= 400:
                 raise Exception(f"HTTP {status_code}: {response.reason}")
             
-            return html_content, status_code
+            charset = response.charset
+            if charset and charset.lower() not in ("utf-8", "utf8"):
+                try:
+                    return body.decode(charset, errors="replace"), status_code
+                except LookupError:
+                    logger.warning(f"Unknown charset {charset} for {url}")
+            
+            return body, status_code
     
-    async def _crawl_with_browser(self, url: str) -> tuple[str, int]:
-        """Crawl URL using headless browser (for JavaScript-heavy sites)."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+    async def _crawl_with_browser(self, url: str, wait_selector: Optional[str] = None,
+                                  scroll: bool = False) -> tuple[str, int]:
+        """
+        Crawl URL using headless browser (for JavaScript-heavy sites).
+        
+        Args:
+            url: URL to crawl
+            wait_selector: CSS selector of the content container to wait for
+            scroll: Whether to scroll to the bottom to trigger lazy loading
+            
+        Returns:
+            Tuple of rendered HTML and HTTP status code
+        """
+        async with self._browser_context() as context:
+            page = await context.new_page()
             try:
-                page = await browser.new_page()
-                
-                # Set user agent
-                await page.set_extra_http_headers(crawling_settings.HEADERS)
-                
                 response = await page.goto(url, wait_until="domcontentloaded")
                 
                 if not response:
                     raise Exception("Failed to load page")
                 
+                if scroll:
+                    await page.evaluate(
+                        "window.scrollTo(0, document.documentElement.scrollHeight)"
+                    )
+                
                 # Wait for content to load
-                await page.wait_for_timeout(2000)
+                await self._wait_for_content(page, wait_selector)
                 
                 html_content = await page.content()
                 status_code = response.status
@@ -392,13 +1054,85 @@ class BlogCrawler:
                 return html_content, status_code
             
             finally:
-                await browser.close()
+                await page.close()
+    
+    async def _wait_for_content(self, page: Page, wait_selector: Optional[str]) -> None:
+        """Wait until the content container is attached or the network settles."""
+        if wait_selector:
+            try:
+                await page.wait_for_selector(
+                    wait_selector,
+                    state="attached",
+                    timeout=crawling_settings.BROWSER_SELECTOR_TIMEOUT
+                )
+                return
+            except PlaywrightTimeoutError:
+                logger.debug(f"Content selector not found on {page.url}")
+        
+        try:
+            await page.wait_for_load_state(
+                "networkidle", timeout=crawling_settings.BROWSER_IDLE_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            logger.warning(f"Timed out waiting for {page.url} to settle")
+    
+    @asynccontextmanager
+    async def _browser_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Borrow a fresh browser context from the pool.
+        
+        A context is never reused: localStorage, sessionStorage, permissions
+        and the HTTP cache would otherwise carry over from one site to the
+        next. The used context is closed and a replacement is created for
+        the next borrower.
+        """
+        pool = await self._get_context_pool()
+        context = await pool.get()
+        try:
+            if context is None:
+                context = await self._new_context()
+        except BaseException:
+            pool.put_nowait(None)
+            raise
+        
+        try:
+            yield context
+        finally:
+            await self._recycle_context(pool, context)
+    
+    async def _recycle_context(
+        self, pool: "asyncio.Queue[Optional[BrowserContext]]", context: BrowserContext
+    ) -> None:
+        """Close a used context and refill its pool slot."""
+        replacement = None
+        try:
+            await context.close()
+            replacement = await self._new_context()
+        except Exception as e:
+            # The slot stays empty; the next borrower creates the context
+            logger.warning(f"Could not recycle browser context: {e}")
+        finally:
+            pool.put_nowait(replacement)
+    
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context; user agent and other headers are set per context."""
+        return await self._browser.new_context(extra_http_headers=crawling_settings.HEADERS)
+    
+    async def _get_context_pool(self) -> "asyncio.Queue[Optional[BrowserContext]]":
+        """Launch the headless browser on first use and fill the context pool."""
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                
+                for _ in range(crawling_settings.BROWSER_CONTEXTS):
+                    self._context_pool.put_nowait(await self._new_context())
+        
+        return self._context_pool
     
     def _needs_browser(self, platform: Optional[str]) -> bool:
         """Determine if platform needs browser rendering."""
-        # Platforms that heavily use JavaScript
-        browser_platforms = {"naver", "medium"}
-        return platform in browser_platforms
+        return platform in self.BROWSER_PLATFORMS
     
     async def crawl_multiple(self, urls: List[str]) -> List[CrawlResult]:
         """
@@ -410,30 +1144,143 @@ class BlogCrawler:
         Returns:
             List of CrawlResult objects
         """
-        semaphore = asyncio.Semaphore(settings.CONCURRENT_REQUESTS)
+        crawl_results: List[Optional[CrawlResult]] = [None] * len(urls)
+        async for index, result in self._crawl_indexed(urls):
+            crawl_results[index] = result
+        
+        return crawl_results
+    
+    async def crawl_multiple_iter(self, urls: List[str]) -> AsyncIterator[CrawlResult]:
+        """
+        Crawl multiple URLs concurrently, yielding results as they complete.
+        
+        Results arrive in completion order rather than input order, so large
+        batches can be consumed without holding every result in memory.
+        
+        Args:
+            urls: List of URLs to crawl
+            
+        Yields:
+            CrawlResult objects
+        """
+        async for _, result in self._crawl_indexed(urls):
+            yield result
+    
+    async def _crawl_indexed(
+        self, urls: List[str]
+    ) -> AsyncIterator[Tuple[int, CrawlResult]]:
+        """Crawl URLs concurrently, yielding (input index, result) pairs."""
+        semaphore = asyncio.Semaphore(get_settings().CONCURRENT_REQUESTS)
         
-        async def crawl_with_semaphore(url: str) -> CrawlResult:
+        async def crawl_with_semaphore(index: int, url: str) -> Tuple[int, CrawlResult]:
             async with semaphore:
-                return await self.crawl_url(url)
-        
-        tasks = [crawl_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        crawl_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                crawl_results.append(
-                    CrawlResult(
-                        url=urls[i],
+                try:
+                    return index, await self.crawl_url(url)
+                except Exception as e:
+                    return index, CrawlResult(
+                        url=url,
                         success=False,
-                        error_message=str(result)
+                        error_message=str(e)
                     )
-                )
-            else:
-                crawl_results.append(result)
         
-        return crawl_results
+        tasks = [
+            asyncio.create_task(crawl_with_semaphore(index, url))
+            for index, url in enumerate(urls)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Stop outstanding crawls if the consumer exits early
+            for task in tasks:
+                task.cancel()
+
+
+# Crawler shared by the convenience functions, tied to the loop it was made on
+_shared_crawler: Optional[BlogCrawler] = None
+_shared_crawler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Serializes opening the shared crawler; a lock only works on its own loop
+_shared_crawler_lock: Optional[asyncio.Lock] = None
+_shared_crawler_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _current_shared_crawler() -> Optional[BlogCrawler]:
+    """
+    Get the shared crawler if it was opened on the running event loop.
+    
+    A crawler left behind by a loop that has since ended cannot be closed
+    from this one, so it is dropped.
+    """
+    global _shared_crawler, _shared_crawler_loop
+    
+    crawler = _shared_crawler
+    if crawler is None or _shared_crawler_loop is asyncio.get_running_loop():
+        return crawler
+    
+    logger.warning(
+        "Shared crawler was not closed before its event loop ended; its HTTP "
+        "session and browser leak. Call close_shared_crawler() on shutdown."
+    )
+    _shared_crawler = None
+    _shared_crawler_loop = None
+    return None
+
+
+async def get_shared_crawler() -> BlogCrawler:
+    """
+    Open (or get) the long-lived crawler used by the convenience functions.
+    
+    Reusing one crawler keeps the aiohttp connection pool, DNS cache and
+    browser alive between calls. Only worthwhile in a service whose event
+    loop outlives the calls: call this from the startup hook and
+    close_shared_crawler() from the shutdown hook, since nothing else closes
+    it. Until it is opened, every convenience call uses its own crawler.
+    
+    Returns:
+        Initialized BlogCrawler
+    """
+    global _shared_crawler, _shared_crawler_loop
+    global _shared_crawler_lock, _shared_crawler_lock_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_crawler_lock_loop is not loop:
+        _shared_crawler_lock = asyncio.Lock()
+        _shared_crawler_lock_loop = loop
+    
+    # Opening awaits, so concurrent callers could otherwise open two crawlers
+    async with _shared_crawler_lock:
+        crawler = _current_shared_crawler()
+        if crawler is None:
+            crawler = BlogCrawler()
+            await crawler.__aenter__()
+            _shared_crawler = crawler
+            _shared_crawler_loop = loop
+    
+    return crawler
+
+
+async def close_shared_crawler() -> None:
+    """Close the shared crawler; must be called from the application shutdown hook."""
+    global _shared_crawler, _shared_crawler_loop
+    
+    crawler = _current_shared_crawler()
+    _shared_crawler = None
+    _shared_crawler_loop = None
+    if crawler is not None:
+        await crawler.__aexit__(None, None, None)
+
+
+@asynccontextmanager
+async def _convenience_crawler() -> AsyncIterator[BlogCrawler]:
+    """Use the shared crawler if one is open on this loop, else a scoped one."""
+    crawler = _current_shared_crawler()
+    if crawler is not None:
+        yield crawler
+        return
+    
+    async with BlogCrawler() as crawler:
+        yield crawler
 
 
 # Convenience function for single URL crawling
@@ -448,7 +1295,7 @@ async def crawl_blog_url(url: str, use_browser: bool = False) -> CrawlResult:
     Returns:
         CrawlResult with extracted data
     """
-    async with BlogCrawler() as crawler:
+    async with _convenience_crawler() as crawler:
         return await crawler.crawl_url(url, use_browser)
 
 
@@ -463,5 +1310,5 @@ async def crawl_blog_urls(urls: List[str]) -> List[CrawlResult]:
     Returns:
         List of CrawlResult objects
     """
-    async with BlogCrawler() as crawler:
-        return await crawler.crawl_multiple(urls) 
\ No newline at end of file
+    async with _convenience_crawler() as crawler:
+        return await crawler.crawl_multiple(urls)
@@ -5,20 +5,112 @@ This module provides comprehensive SEO analysis including keyword density,
 meta data optimization, heading structure, link analysis, and technical SEO.
 """
 
+import copy
+import hashlib
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup, Comment
-from textstat import flesch_reading_ease, flesch_kincaid_grade
+from bs4 import BeautifulSoup, Comment, Tag
 
 from backend.shared.models import CrawlResult
 
+# Aho-Corasick counts every target keyword in a single pass over the content
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml tree builder; fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Words of two or more characters
+WORD_RE = re.compile(r'\b\w{2,}\b')
+
+# Runs of sentence-ending punctuation
+SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+# Syllable estimate: English vowel groups, or one per Hangul syllable block
+SYLLABLE_RE = re.compile(r'[aeiouy]+|[\uac00-\ud7a3]', re.IGNORECASE)
+
+# A word-final silent "e" after a consonant ("make", "since"), but not "-le"
+SILENT_E_RE = re.compile(r'[^\Waeiouyl]e\W*$', re.IGNORECASE)
+
+# Network location of a URL with an authority ("https://host/...", "//host")
+NETLOC_RE = re.compile(r'(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//([^/?#\s]*)(?:[/?#]|$)')
+
+# URL paths made only of word characters, hyphens and slashes
+URL_PATH_RE = re.compile(r'^/[\w\-/]*$')
+
+HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+
+
+def _collect_nodes(soup: BeautifulSoup) -> Dict[str, Any]:
+    """
+    Collect the elements every analyzer needs in a single walk over the tree.
+    
+    Args:
+        soup: BeautifulSoup object of the page
+        
+    Returns:
+        Dictionary of element lists, with headings grouped by level
+    """
+    nodes: Dict[str, Any] = {
+        "meta_og": [],
+        "meta_twitter": [],
+        "headings": {level: [] for level in HEADING_LEVELS.values()},
+        "links": [],
+        "images": [],
+        "jsonld": [],
+        "itemtype": [],
+        "typeof": []
+    }
+    headings = nodes["headings"]
+    
+    for elem in soup.descendants:
+        if not isinstance(elem, Tag):
+            continue
+        
+        name = elem.name
+        attrs = elem.attrs
+        if name == "meta":
+            prop = attrs.get("property")
+            if prop and prop.startswith("og:"):
+                nodes["meta_og"].append(elem)
+            meta_name = attrs.get("name")
+            if meta_name and meta_name.startswith("twitter:"):
+                nodes["meta_twitter"].append(elem)
+        elif name == "a":
+            if attrs.get("href") is not None:
+                nodes["links"].append(elem)
+        elif name == "img":
+            nodes["images"].append(elem)
+        elif name == "script":
+            if attrs.get("type") == "application/ld+json":
+                nodes["jsonld"].append(elem)
+        elif name in HEADING_LEVELS:
+            headings[HEADING_LEVELS[name]].append(elem)
+        
+        if attrs.get("itemtype") is not None:
+            nodes["itemtype"].append(elem)
+        if attrs.get("typeof") is not None:
+            nodes["typeof"].append(elem)
+    
+    return nodes
+
 
 class KeywordAnalyzer:
     """Analyzes keyword density and distribution."""
@@ -28,6 +120,9 @@ class KeywordAnalyzer:
         self.title = title.lower() if title else ""
         self.meta_description = meta_description.lower() if meta_description else ""
         self.word_count = len(self.content.split()) if self.content else 0
+        
+        # Tokenized once and shared by every analyze_keyword_density call
+        self.words = WORD_RE.findall(self.content)
     
     def analyze_keyword_density(self, target_keywords: List[str] = None) -> Dict[str, Any]:
         """
@@ -42,21 +137,18 @@ class KeywordAnalyzer:
         if not self.content:
             return {"error": "No content to analyze"}
         
-        # Extract all words (2+ characters)
-        words = re.findall(r'\b\w{2,}\b', self.content)
+        words = self.words
         total_words = len(words)
         
         if total_words == 0:
             return {"error": "No words found in content"}
         
         # Count word frequencies
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+        word_freq = Counter(words)
         
         # Calculate density for most common words
         keyword_density = {}
-        for word, count in sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:20]:
+        for word, count in word_freq.most_common(20):
             density = (count / total_words) * 100
             keyword_density[word] = {
                 "count": count,
@@ -66,14 +158,17 @@ class KeywordAnalyzer:
         # Analyze target keywords if provided
         target_analysis = {}
         if target_keywords:
+            keyword_counts, title_hits, meta_hits = self._scan_keywords(
+                [keyword.lower() for keyword in target_keywords]
+            )
             for keyword in target_keywords:
                 keyword_lower = keyword.lower()
-                count = self.content.count(keyword_lower)
+                count = keyword_counts[keyword_lower]
                 density = (count / total_words) * 100 if total_words > 0 else 0
                 
                 # Check keyword placement
-                in_title = keyword_lower in self.title
-                in_meta = keyword_lower in self.meta_description
+                in_title = keyword_lower in title_hits
+                in_meta = keyword_lower in meta_hits
                 
                 target_analysis[keyword] = {
                     "count": count,
@@ -93,6 +188,49 @@ class KeywordAnalyzer:
             "recommendations": self._get_keyword_recommendations(keyword_density, target_analysis)
         }
     
+    def _scan_keywords(self, keywords: List[str]) -> Tuple[Dict[str, int], Set[str], Set[str]]:
+        """
+        Count keywords in the content and find those in the title and meta description.
+        
+        Args:
+            keywords: Lowercased keywords
+            
+        Returns:
+            Tuple of (count per keyword, as str.count gives; keywords found in
+            the title; keywords found in the meta description)
+        """
+        unique = {keyword for keyword in keywords if keyword}
+        
+        # A couple of substring scans are cheaper than building an automaton
+        if ahocorasick is None or len(unique) <= 2:
+            return (
+                {keyword: self.content.count(keyword) for keyword in keywords},
+                {keyword for keyword in keywords if keyword in self.title},
+                {keyword for keyword in keywords if keyword in self.meta_description}
+            )
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in unique:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        
+        # The automaton cannot hold an empty keyword; str.count gives len + 1 for it
+        counts = {keyword: 0 if keyword else len(self.content) + 1 for keyword in keywords}
+        last_end: Dict[str, int] = {}
+        for end, keyword in automaton.iter(self.content):
+            # Skip matches overlapping the previous one, like str.count does
+            if end - len(keyword) >= last_end.get(keyword, -1):
+                counts[keyword] += 1
+                last_end[keyword] = end
+        
+        # The same automaton finds every keyword in the title and meta
+        # description in one pass each; an empty keyword is in any string
+        empty = {keyword for keyword in keywords if not keyword}
+        title_hits = empty.union(keyword for _, keyword in automaton.iter(self.title))
+        meta_hits = empty.union(keyword for _, keyword in automaton.iter(self.meta_description))
+        
+        return counts, title_hits, meta_hits
+    
     def _calculate_placement_score(self, keyword: str, in_title: bool, 
                                    in_meta: bool, density: float) -> int:
         """Calculate keyword placement score (0-100)."""
@@ -146,12 +284,15 @@ class KeywordAnalyzer:
 class MetaDataAnalyzer:
     """Analyzes meta data optimization."""
     
-    def analyze_meta_data(self, soup: BeautifulSoup, crawl_result: CrawlResult) -> Dict[str, Any]:
+    # Words that signal an actionable or benefit-driven description
+    ACTION_WORDS = frozenset({"how", "why", "what", "best", "guide"})
+    
+    def analyze_meta_data(self, nodes: Dict[str, Any], crawl_result: CrawlResult) -> Dict[str, Any]:
         """
         Analyze meta data optimization.
         
         Args:
-            soup: BeautifulSoup object of the page
+            nodes: Page elements collected by _collect_nodes
             crawl_result: Crawling result with extracted data
             
         Returns:
@@ -160,9 +301,11 @@ class MetaDataAnalyzer:
         analysis = {
             "title": self._analyze_title(crawl_result.title),
             "meta_description": self._analyze_meta_description(crawl_result.meta_description),
-            "open_graph": self._analyze_open_graph(soup),
-            "twitter_cards": self._analyze_twitter_cards(soup),
-            "schema_markup": self._analyze_schema_markup(soup),
+            "open_graph": self._analyze_open_graph(nodes["meta_og"]),
+            "twitter_cards": self._analyze_twitter_cards(nodes["meta_twitter"]),
+            "schema_markup": self._analyze_schema_markup(
+                nodes["jsonld"], nodes["itemtype"], nodes["typeof"]
+            ),
             "overall_score": 0
         }
         
@@ -204,7 +347,7 @@ class MetaDataAnalyzer:
             recommendations.append("Consider shortening title to under 60 characters")
         
         # Content analysis
-        if any(char.isupper() for char in title):
+        if any(map(str.isupper, title)):
             score += 20
         else:
             issues.append("No capital letters in title")
@@ -254,7 +397,8 @@ class MetaDataAnalyzer:
             recommendations.append("Shorten meta description to under 160 characters")
         
         # Content analysis
-        if any(word in description.lower() for word in ['how', 'why', 'what', 'best', 'guide']):
+        description_lower = description.lower()
+        if any(word in description_lower for word in self.ACTION_WORDS):
             score += 25
         else:
             recommendations.append("Consider adding action words or benefits")
@@ -271,10 +415,10 @@ class MetaDataAnalyzer:
             "recommendations": recommendations
         }
     
-    def _analyze_open_graph(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_open_graph(self, meta_tags: List[Tag]) -> Dict[str, Any]:
         """Analyze Open Graph meta tags."""
         og_tags = {}
-        for tag in soup.find_all("meta", property=lambda x: x and x.startswith("og:")):
+        for tag in meta_tags:
             property_name = tag.get("property", "").replace("og:", "")
             og_tags[property_name] = tag.get("content", "")
         
@@ -297,10 +441,10 @@ class MetaDataAnalyzer:
             "recommendations": recommendations
         }
     
-    def _analyze_twitter_cards(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_twitter_cards(self, meta_tags: List[Tag]) -> Dict[str, Any]:
         """Analyze Twitter Card meta tags."""
         twitter_tags = {}
-        for tag in soup.find_all("meta", attrs={"name": lambda x: x and x.startswith("twitter:")}):
+        for tag in meta_tags:
             name = tag.get("name", "").replace("twitter:", "")
             twitter_tags[name] = tag.get("content", "")
         
@@ -317,59 +461,57 @@ class MetaDataAnalyzer:
             "tags": twitter_tags
         }
     
-    def _analyze_schema_markup(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_schema_markup(self, jsonld: List[Tag], itemtype: List[Tag],
+                               typeof: List[Tag]) -> Dict[str, Any]:
         """Analyze structured data markup."""
-        schema_types = []
-        
-        # JSON-LD
-        for script in soup.find_all("script", type="application/ld+json"):
-            schema_types.append("JSON-LD")
-        
-        # Microdata
-        for elem in soup.find_all(attrs={"itemtype": True}):
-            schema_types.append("Microdata")
-        
-        # RDFa
-        for elem in soup.find_all(attrs={"typeof": True}):
-            schema_types.append("RDFa")
+        # JSON-LD, Microdata and RDFa
+        found = (("JSON-LD", jsonld), ("Microdata", itemtype), ("RDFa", typeof))
+        count = sum(len(elems) for _, elems in found)
         
-        score = min(100, len(schema_types) * 50)
+        score = min(100, count * 50)
         
         return {
             "score": score,
-            "types": list(set(schema_types)),
-            "count": len(schema_types)
+            "types": [name for name, elems in found if elems],
+            "count": count
         }
 
 
 class HeadingAnalyzer:
     """Analyzes heading structure and hierarchy."""
     
-    def analyze_headings(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def analyze_headings(self, heading_tags_by_level: Dict[int, List[Tag]]) -> Dict[str, Any]:
         """
         Analyze heading structure.
         
         Args:
-            soup: BeautifulSoup object of the page
+            heading_tags_by_level: Heading elements keyed by level (1-6)
             
         Returns:
             Dictionary with heading analysis
         """
         headings = []
+        headings_by_level: Dict[int, List[Dict]] = {}
         for i in range(1, 7):
-            heading_tags = soup.find_all(f"h{i}")
+            heading_tags = heading_tags_by_level.get(i, [])
+            if not heading_tags:
+                continue
+            
+            level_headings = headings_by_level[i] = []
             for tag in heading_tags:
-                headings.append({
+                text = tag.get_text(strip=True)
+                level_headings.append({
                     "level": i,
-                    "text": tag.get_text(strip=True),
-                    "length": len(tag.get_text(strip=True))
+                    "text": text,
+                    "length": len(text)
                 })
+            headings.extend(level_headings)
         
         analysis = {
             "headings": headings,
-            "structure": self._analyze_structure(headings),
-            "h1_analysis": self._analyze_h1(headings),
-            "hierarchy_score": self._calculate_hierarchy_score(headings),
+            "structure": self._analyze_structure(headings_by_level),
+            "h1_analysis": self._analyze_h1(headings_by_level.get(1, [])),
+            "hierarchy_score": self._calculate_hierarchy_score(headings_by_level),
             "recommendations": []
         }
         
@@ -377,21 +519,15 @@ class HeadingAnalyzer:
         
         return analysis
     
-    def _analyze_structure(self, headings: List[Dict]) -> Dict[str, Any]:
+    def _analyze_structure(self, headings_by_level: Dict[int, List[Dict]]) -> Dict[str, Any]:
         """Analyze heading structure."""
-        structure = {}
-        for heading in headings:
-            level = f"h{heading['level']}"
-            if level not in structure:
-                structure[level] = 0
-            structure[level] += 1
-        
-        return structure
+        return {
+            f"h{level}": len(level_headings)
+            for level, level_headings in headings_by_level.items()
+        }
     
-    def _analyze_h1(self, headings: List[Dict]) -> Dict[str, Any]:
+    def _analyze_h1(self, h1_tags: List[Dict]) -> Dict[str, Any]:
         """Analyze H1 tags specifically."""
-        h1_tags = [h for h in headings if h["level"] == 1]
-        
         analysis = {
             "count": len(h1_tags),
             "score": 0,
@@ -416,22 +552,19 @@ class HeadingAnalyzer:
         
         return analysis
     
-    def _calculate_hierarchy_score(self, headings: List[Dict]) -> int:
+    def _calculate_hierarchy_score(self, headings_by_level: Dict[int, List[Dict]]) -> int:
         """Calculate heading hierarchy score."""
-        if not headings:
+        if not headings_by_level:
             return 0
         
         score = 0
         
-        # Check for logical hierarchy
-        levels = [h["level"] for h in headings]
-        
-        # H1 should come first
-        if levels and levels[0] == 1:
+        # H1 should come first; headings are listed by level, so any H1 does
+        if 1 in headings_by_level:
             score += 30
         
         # No skipped levels
-        unique_levels = sorted(set(levels))
+        unique_levels = sorted(headings_by_level)
         if all(unique_levels[i] - unique_levels[i-1] <= 1 for i in range(1, len(unique_levels))):
             score += 40
         
@@ -453,7 +586,7 @@ class HeadingAnalyzer:
         if analysis["hierarchy_score"] < 70:
             recommendations.append("Improve heading hierarchy structure")
         
-        if not any(h["level"] == 2 for h in analysis["headings"]):
+        if "h2" not in analysis["structure"]:
             recommendations.append("Consider adding H2 subheadings for better structure")
         
         return recommendations
@@ -462,12 +595,12 @@ class HeadingAnalyzer:
 class LinkAnalyzer:
     """Analyzes internal and external links."""
     
-    def analyze_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+    def analyze_links(self, link_tags: List[Tag], base_url: str) -> Dict[str, Any]:
         """
         Analyze link structure and quality.
         
         Args:
-            soup: BeautifulSoup object of the page
+            link_tags: <a> elements that have an href
             base_url: Base URL for relative link resolution
             
         Returns:
@@ -475,8 +608,12 @@ class LinkAnalyzer:
         """
         links = []
         base_domain = urlparse(base_url).netloc
+        internal_count = 0
+        text_count = 0
+        descriptive_count = 0
+        nofollow_count = 0
         
-        for link in soup.find_all("a", href=True):
+        for link in link_tags:
             href = link["href"]
             text = link.get_text(strip=True)
             
@@ -486,26 +623,48 @@ class LinkAnalyzer:
             else:
                 full_url = href
             
-            link_domain = urlparse(full_url).netloc
+            # Most hrefs need no urlparse: the pattern covers absolute URLs and
+            # anything without "//" has no network location
+            match = NETLOC_RE.match(full_url)
+            if match:
+                link_domain = match.group(1)
+            elif "//" in full_url:
+                link_domain = urlparse(full_url).netloc
+            else:
+                link_domain = ""
             is_internal = link_domain == base_domain or not link_domain
+            is_nofollow = "nofollow" in link.get("rel", [])
+            
+            # Tally counts while building the list instead of re-scanning it
+            if is_internal:
+                internal_count += 1
+            if text:
+                text_count += 1
+                if len(text) > 3:
+                    descriptive_count += 1
+            if is_nofollow:
+                nofollow_count += 1
             
             links.append({
                 "url": full_url,
                 "text": text,
                 "is_internal": is_internal,
                 "has_text": bool(text),
-                "is_nofollow": "nofollow" in link.get("rel", []),
+                "is_nofollow": is_nofollow,
                 "opens_new_tab": link.get("target") == "_blank"
             })
         
+        external_count = len(links) - internal_count
         analysis = {
             "total_links": len(links),
-            "internal_links": len([l for l in links if l["is_internal"]]),
-            "external_links": len([l for l in links if not l["is_internal"]]),
-            "links_with_text": len([l for l in links if l["has_text"]]),
-            "nofollow_links": len([l for l in links if l["is_nofollow"]]),
+            "internal_links": internal_count,
+            "external_links": external_count,
+            "links_with_text": text_count,
+            "nofollow_links": nofollow_count,
             "links": links,
-            "score": self._calculate_link_score(links),
+            "score": self._calculate_link_score(
+                len(links), internal_count, external_count, descriptive_count
+            ),
             "recommendations": []
         }
         
@@ -513,17 +672,15 @@ class LinkAnalyzer:
         
         return analysis
     
-    def _calculate_link_score(self, links: List[Dict]) -> int:
+    def _calculate_link_score(self, total: int, internal_count: int,
+                              external_count: int, descriptive_count: int) -> int:
         """Calculate link optimization score."""
-        if not links:
+        if not total:
             return 50
         
         score = 0
         
         # Good ratio of internal to external links
-        internal_count = len([l for l in links if l["is_internal"]])
-        external_count = len([l for l in links if not l["is_internal"]])
-        
         if internal_count > 0:
             score += 30
         
@@ -531,8 +688,7 @@ class LinkAnalyzer:
             score += 20
         
         # Links have descriptive text
-        links_with_text = len([l for l in links if l["has_text"] and len(l["text"]) > 3])
-        text_ratio = links_with_text / len(links) if links else 0
+        text_ratio = descriptive_count / total
         score += int(text_ratio * 50)
         
         return min(100, score)
@@ -570,25 +726,30 @@ class ReadabilityAnalyzer:
         if not content:
             return {"error": "No content to analyze"}
         
+        # Sentence analysis: one split gives both the count and the lengths
+        sentence_lengths = [
+            len(sentence.split())
+            for sentence in SENTENCE_END_RE.split(content)
+            if sentence.strip()
+        ]
+        
         # Basic statistics
-        sentences = len(re.findall(r'[.!?]+', content))
-        words = len(content.split())
+        sentences = len(sentence_lengths)
+        word_list = content.split()
+        words = len(word_list)
         characters = len(content)
         
-        # Readability scores
-        flesch_score = flesch_reading_ease(content)
-        fk_grade = flesch_kincaid_grade(content)
+        # Readability scores, from the counts above
+        syllables = sum(map(self._count_syllables, word_list))
+        words_per_sentence = words / max(sentences, 1)
+        syllables_per_word = syllables / words if words else 0
+        flesch_score = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        fk_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
         
         # Paragraph analysis
         paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
         avg_paragraph_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs) if paragraphs else 0
         
-        # Sentence analysis
-        sentence_lengths = []
-        for sentence in re.split(r'[.!?]+', content):
-            if sentence.strip():
-                sentence_lengths.append(len(sentence.split()))
-        
         avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
         
         analysis = {
@@ -612,6 +773,11 @@ class ReadabilityAnalyzer:
         
         return analysis
     
+    @staticmethod
+    def _count_syllables(word: str) -> int:
+        """Estimate the syllables in a word; every word has at least one."""
+        return max(1, len(SYLLABLE_RE.findall(word)) - bool(SILENT_E_RE.search(word)))
+    
     def _get_reading_level(self, flesch_score: float) -> str:
         """Convert Flesch score to reading level."""
         if flesch_score >= 90:
@@ -684,12 +850,31 @@ class ReadabilityAnalyzer:
 class SEOAnalyzer:
     """Main SEO analyzer that combines all analysis modules."""
     
+    # Number of pages whose keyword-independent analyses are kept
+    STRUCTURAL_CACHE_SIZE = 128
+    
+    # Analysis modules whose recommendations are merged, in report order
+    MODULE_KEYS = (
+        "keyword_analysis", "meta_analysis", "heading_analysis",
+        "link_analysis", "readability_analysis", "technical_seo"
+    )
+    
+    # Overall score bands (<50, <70, <90, 90+) and the advice that leads each
+    SCORE_THRESHOLDS = (50, 70, 90)
+    SCORE_PREFIXES = (
+        "Focus on improving meta tags and content structure",
+        "Good foundation - focus on keyword optimization and readability",
+        "Strong SEO - fine-tune technical aspects for perfection",
+        None
+    )
+    
     def __init__(self):
-        self.keyword_analyzer = None
         self.meta_analyzer = MetaDataAnalyzer()
         self.heading_analyzer = HeadingAnalyzer()
         self.link_analyzer = LinkAnalyzer()
         self.readability_analyzer = ReadabilityAnalyzer()
+        self._structural_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._structural_lock = threading.Lock()
     
     def analyze(self, crawl_result: CrawlResult, target_keywords: List[str] = None) -> Dict[str, Any]:
         """
@@ -705,29 +890,24 @@ class SEOAnalyzer:
         if not crawl_result.success:
             return {"error": f"Crawling failed: {crawl_result.error_message}"}
         
-        # Parse HTML for detailed analysis
-        soup = BeautifulSoup(crawl_result.content or "", "html.parser") if crawl_result.content else None
-        
-        if not soup:
+        if not crawl_result.content:
             return {"error": "No content to analyze"}
         
         # Initialize keyword analyzer
-        self.keyword_analyzer = KeywordAnalyzer(
+        keyword_analyzer = KeywordAnalyzer(
             crawl_result.content or "",
             crawl_result.title or "",
             crawl_result.meta_description or ""
         )
         
+        structural = self._get_structural_analysis(crawl_result)
+        
         # Perform all analyses
         analysis = {
             "url": crawl_result.url,
             "timestamp": crawl_result,
-            "keyword_analysis": self.keyword_analyzer.analyze_keyword_density(target_keywords),
-            "meta_analysis": self.meta_analyzer.analyze_meta_data(soup, crawl_result),
-            "heading_analysis": self.heading_analyzer.analyze_headings(soup),
-            "link_analysis": self.link_analyzer.analyze_links(soup, crawl_result.url),
-            "readability_analysis": self.readability_analyzer.analyze_readability(crawl_result.content or ""),
-            "technical_seo": self._analyze_technical_seo(soup, crawl_result),
+            "keyword_analysis": keyword_analyzer.analyze_keyword_density(target_keywords),
+            **structural,
             "overall_score": 0,
             "recommendations": []
         }
@@ -740,14 +920,75 @@ class SEOAnalyzer:
         
         return analysis
     
-    def _analyze_technical_seo(self, soup: BeautifulSoup, crawl_result: CrawlResult) -> Dict[str, Any]:
+    def analyze_batch(self, crawl_results: List[CrawlResult],
+                      target_keywords: List[str] = None,
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze multiple crawl results concurrently.
+        
+        Args:
+            crawl_results: Results from web crawling
+            target_keywords: Optional list of target keywords, applied to every page
+            max_workers: Thread pool size; defaults to ThreadPoolExecutor's choice
+            
+        Returns:
+            List of analyses, in the same order as crawl_results
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda crawl_result: self.analyze(crawl_result, target_keywords),
+                crawl_results
+            ))
+    
+    def _get_structural_analysis(self, crawl_result: CrawlResult) -> Dict[str, Any]:
+        """
+        Get the analyses that do not depend on target keywords.
+        
+        Results are cached per URL, content hash, title and meta description,
+        so re-analyzing a page with new keywords skips parsing entirely. Each
+        call gets its own copy, so callers may modify the result.
+        """
+        content_hash = hashlib.blake2b(
+            crawl_result.content.encode(), digest_size=8
+        ).digest()
+        key = (
+            crawl_result.url, content_hash,
+            crawl_result.title, crawl_result.meta_description
+        )
+        
+        with self._structural_lock:
+            structural = self._structural_cache.get(key)
+            if structural is not None:
+                self._structural_cache.move_to_end(key)
+                return copy.deepcopy(structural)
+        
+        # Parse HTML and collect the elements every analyzer needs in one pass
+        soup = BeautifulSoup(crawl_result.content, HTML_PARSER)
+        nodes = _collect_nodes(soup)
+        
+        structural = {
+            "meta_analysis": self.meta_analyzer.analyze_meta_data(nodes, crawl_result),
+            "heading_analysis": self.heading_analyzer.analyze_headings(nodes["headings"]),
+            "link_analysis": self.link_analyzer.analyze_links(nodes["links"], crawl_result.url),
+            "readability_analysis": self.readability_analyzer.analyze_readability(crawl_result.content),
+            "technical_seo": self._analyze_technical_seo(nodes, crawl_result)
+        }
+        
+        with self._structural_lock:
+            self._structural_cache[key] = structural
+            if len(self._structural_cache) > self.STRUCTURAL_CACHE_SIZE:
+                self._structural_cache.popitem(last=False)
+        
+        return copy.deepcopy(structural)
+    
+    def _analyze_technical_seo(self, nodes: Dict[str, Any], crawl_result: CrawlResult) -> Dict[str, Any]:
         """Analyze technical SEO factors."""
         analysis = {
             "page_speed": {"score": 85, "issues": []},  # Placeholder - would integrate with PageSpeed API
             "mobile_friendly": {"score": 90, "issues": []},  # Placeholder - would check viewport etc.
             "ssl": {"enabled": crawl_result.url.startswith("https://"), "score": 100 if crawl_result.url.startswith("https://") else 0},
             "url_structure": self._analyze_url_structure(crawl_result.url),
-            "images": self._analyze_images(soup)
+            "images": self._analyze_images(nodes["images"])
         }
         
         return analysis
@@ -767,7 +1008,7 @@ class SEOAnalyzer:
             issues.append("URL too long")
         
         # Readable structure
-        if re.match(r'^/[\w\-/]*$', path):
+        if URL_PATH_RE.match(path):
             score += 30
         else:
             issues.append("URL contains special characters")
@@ -782,15 +1023,14 @@ class SEOAnalyzer:
             "issues": issues
         }
     
-    def _analyze_images(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_images(self, images: List[Tag]) -> Dict[str, Any]:
         """Analyze image optimization."""
-        images = soup.find_all("img")
         total_images = len(images)
         
         if total_images == 0:
             return {"score": 100, "total_images": 0, "issues": []}
         
-        images_with_alt = len([img for img in images if img.get("alt")])
+        images_with_alt = sum(1 for img in images if img.get("alt"))
         alt_ratio = images_with_alt / total_images
         
         score = int(alt_ratio * 100)
@@ -830,21 +1070,24 @@ class SEOAnalyzer:
         
         return int(sum(scores)) if scores else 0
     
-    def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
-        """Generate overall recommendations."""
-        recommendations = []
-        
-        # Collect recommendations from all modules
-        for module_name, module_data in analysis.items():
-            if isinstance(module_data, dict) and "recommendations" in module_data:
-                recommendations.extend(module_data["recommendations"])
+    def _iter_recommendations(self, analysis: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield overall recommendations, most important first.
         
+        Args:
+            analysis: Complete analysis with module results and overall score
+            
+        Returns:
+            Iterator over the score-based advice, then every module's recommendations
+        """
         # Add overall recommendations based on score
-        if analysis["overall_score"] < 50:
-            recommendations.insert(0, "Focus on improving meta tags and content structure")
-        elif analysis["overall_score"] < 70:
-            recommendations.insert(0, "Good foundation - focus on keyword optimization and readability")
-        elif analysis["overall_score"] < 90:
-            recommendations.insert(0, "Strong SEO - fine-tune technical aspects for perfection")
-        
-        return recommendations[:10]  # Limit to top 10 recommendations 
\ No newline at end of file
+        prefix = self.SCORE_PREFIXES[bisect_right(self.SCORE_THRESHOLDS, analysis["overall_score"])]
+        if prefix:
+            yield prefix
+        
+        for key in self.MODULE_KEYS:
+            yield from analysis[key].get("recommendations", ())
+    
+    def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
+        """Generate overall recommendations."""
+        return list(islice(self._iter_recommendations(analysis), 10))  # Limit to top 10 recommendations 
\ No newline at end of file
@@ -4,15 +4,24 @@ Configuration management for Blog SEO Analyzer.
 This module handles all configuration settings with type hints and validation.
 """
 
-import os
-from typing import List, Optional
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, List, Optional
 
-from pydantic import AnyHttpUrl, BaseSettings, PostgresDsn, RedisDsn, validator
+from pydantic import AnyHttpUrl, PostgresDsn, RedisDsn, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        extra="ignore"
+    )
+
     # API Settings
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
@@ -48,6 +57,9 @@ class Settings(BaseSettings):
     USER_AGENT: str = "BlogSEOAnalyzer/1.0"
     REQUEST_DELAY: float = 1.0
     CONCURRENT_REQUESTS: int = 16
+    CONCURRENT_REQUESTS_PER_DOMAIN: int = 8
+    DNS_CACHE_TTL: int = 300
+    PARSER_WORKERS: int = 2  # 0 parses every page inline
     DOWNLOAD_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
 
@@ -76,28 +88,27 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
 
-    # CORS
-    BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
+    # CORS (a JSON array or a comma-separated list)
+    BACKEND_CORS_ORIGINS: Annotated[List[AnyHttpUrl], NoDecode] = []
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
-    def assemble_cors_origins(cls, v: str | List[str]) -> List[str] | str:
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
+    def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
         """Parse CORS origins from environment variable."""
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
+        if isinstance(v, str):
+            if v.lstrip().startswith("["):
+                return json.loads(v)
+            return [i.strip() for i in v.split(",") if i.strip()]
+        elif isinstance(v, list):
             return v
         raise ValueError(v)
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-
 
 class CrawlingSettings:
     """Crawling-specific settings and configurations."""
 
-    # Platform-specific selectors
-    PLATFORM_SELECTORS = {
+    # Platform-specific selectors (read-only, shared by every extractor)
+    PLATFORM_SELECTORS = MappingProxyType({
         "naver": {
             "title": "h3.se_title, .se-title-text",
             "content": ".se-main-container, .se-component",
@@ -133,7 +144,7 @@ class CrawlingSettings:
             "author": ".by_author",
             "date": ".wrap_date"
         }
-    }
+    })
 
     # Headers for different platforms
     HEADERS = {
@@ -146,16 +157,33 @@ class CrawlingSettings:
         "Upgrade-Insecure-Requests": "1"
     }
 
-    # Rate limiting settings per platform
-    RATE_LIMITS = {
+    # Rate limiting settings per platform (read-only)
+    RATE_LIMITS = MappingProxyType({
         "naver": {"delay": 2.0, "concurrent": 5},
         "tistory": {"delay": 1.0, "concurrent": 10},
         "wordpress": {"delay": 0.5, "concurrent": 20},
         "medium": {"delay": 1.5, "concurrent": 8},
         "brunch": {"delay": 2.0, "concurrent": 5}
-    }
+    })
+
+    # Browser contexts kept open for concurrent JavaScript rendering
+    BROWSER_CONTEXTS = 4
+
+    # Browser rendering waits in milliseconds
+    BROWSER_SELECTOR_TIMEOUT = 5000
+    BROWSER_IDLE_TIMEOUT = 3000
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Returns:
+        Shared Settings instance; call get_settings.cache_clear() to reload
+    """
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
+# Global crawling settings instance
 crawling_settings = CrawlingSettings() 
\ No newline at end of file
@@ -1,14 +1,16 @@
 """
 Shared data models for Blog SEO Analyzer.
 
-This module contains Pydantic models used across different services.
+This module contains Pydantic models used across different services, plus
+plain dataclasses for results that are only passed between services.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class BlogPostBase(BaseModel):
@@ -27,7 +29,22 @@ class BlogPostBase(BaseModel):
 
 class BlogPostCreate(BlogPostBase):
     """Blog post creation model."""
-    pass
+    
+    @classmethod
+    def from_crawl_result(cls, crawl_result: "CrawlResult") -> "BlogPostCreate":
+        """
+        Build a blog post from a crawl result.
+        
+        Fields are read straight off the result's attributes by pydantic-core,
+        without going through an intermediate dict.
+        
+        Args:
+            crawl_result: Successful crawl result
+            
+        Returns:
+            Validated blog post creation model
+        """
+        return cls.model_validate(crawl_result, from_attributes=True)
 
 
 class BlogPostInDB(BlogPostBase):
@@ -38,8 +55,7 @@ class BlogPostInDB(BlogPostBase):
     crawled_at: datetime
     user_id: Optional[UUID] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BlogPost(BlogPostInDB):
@@ -50,7 +66,7 @@ class BlogPost(BlogPostInDB):
 class SEOAnalysisBase(BaseModel):
     """Base SEO analysis model."""
     
-    overall_score: Optional[int] = None
+    overall_score: Annotated[Optional[int], Field(ge=0, le=100)] = None
     keyword_density: Optional[Dict[str, Any]] = None
     meta_score: Optional[int] = None
     heading_structure: Optional[Dict[str, Any]] = None
@@ -59,13 +75,6 @@ class SEOAnalysisBase(BaseModel):
     readability_score: Optional[float] = None
     technical_seo: Optional[Dict[str, Any]] = None
 
-    @validator('overall_score')
-    def validate_score(cls, v):
-        """Validate overall score is between 0 and 100."""
-        if v is not None and (v < 0 or v > 100):
-            raise ValueError('Overall score must be between 0 and 100')
-        return v
-
 
 class SEOAnalysisCreate(SEOAnalysisBase):
     """SEO analysis creation model."""
@@ -79,8 +88,7 @@ class SEOAnalysisInDB(SEOAnalysisBase):
     blog_post_id: UUID
     analyzed_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SEOAnalysis(SEOAnalysisInDB):
@@ -93,18 +101,11 @@ class NLPAnalysisBase(BaseModel):
     
     keywords: Optional[Dict[str, Any]] = None
     topics: Optional[Dict[str, Any]] = None
-    sentiment_score: Optional[float] = None
+    sentiment_score: Annotated[Optional[float], Field(ge=-1.0, le=1.0)] = None
     tone_analysis: Optional[Dict[str, Any]] = None
     entity_extraction: Optional[Dict[str, Any]] = None
     language_quality: Optional[Dict[str, Any]] = None
 
-    @validator('sentiment_score')
-    def validate_sentiment(cls, v):
-        """Validate sentiment score is between -1 and 1."""
-        if v is not None and (v < -1 or v > 1):
-            raise ValueError('Sentiment score must be between -1 and 1')
-        return v
-
 
 class NLPAnalysisCreate(NLPAnalysisBase):
     """NLP analysis creation model."""
@@ -118,8 +119,7 @@ class NLPAnalysisInDB(NLPAnalysisBase):
     blog_post_id: UUID
     analyzed_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NLPAnalysis(NLPAnalysisInDB):
@@ -148,8 +148,7 @@ class CompetitionAnalysisInDB(CompetitionAnalysisBase):
     blog_post_id: UUID
     analyzed_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CompetitionAnalysis(CompetitionAnalysisInDB):
@@ -181,8 +180,7 @@ class AnalysisJobInDB(AnalysisJobBase):
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AnalysisJob(AnalysisJobInDB):
@@ -190,8 +188,14 @@ class AnalysisJob(AnalysisJobInDB):
     pass
 
 
-class CrawlResult(BaseModel):
-    """Crawling result model."""
+@dataclass(slots=True)
+class CrawlResult:
+    """
+    Crawling result model.
+    
+    Built by the crawler from data it has already extracted and handed
+    straight to the analyzers, so it skips validation.
+    """
     
     url: str
     success: bool
@@ -203,25 +207,35 @@ class CrawlResult(BaseModel):
     author: Optional[str] = None
     published_date: Optional[datetime] = None
     platform: Optional[str] = None
-    links: Optional[List[str]] = None
-    images: Optional[List[str]] = None
+    links: Optional[Tuple[str, ...]] = None
+    images: Optional[Tuple[str, ...]] = None
     error_message: Optional[str] = None
     response_time: Optional[float] = None
 
 
+# Analysis types a request may ask for
+_VALID_ANALYSIS_TYPES = frozenset(("seo", "nlp", "competition", "all"))
+
+
 class AnalysisRequest(BaseModel):
     """Analysis request model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     url: HttpUrl
     analysis_types: List[str] = ["seo", "nlp"]  # Default analyses
     priority: int = 1  # 1 = high, 2 = medium, 3 = low
 
-    @validator('analysis_types')
+    @field_validator('analysis_types')
+    @classmethod
     def validate_analysis_types(cls, v):
         """Validate analysis types."""
-        valid_types = {"seo", "nlp", "competition", "all"}
-        if not all(t in valid_types for t in v):
-            raise ValueError(f'Invalid analysis types. Valid types: {valid_types}')
+        invalid = [t for t in v if t not in _VALID_ANALYSIS_TYPES]
+        if invalid:
+            raise ValueError(
+                f'Invalid analysis types: {invalid}. '
+                f'Valid types: {sorted(_VALID_ANALYSIS_TYPES)}'
+            )
         return v
 
 
@@ -257,8 +271,7 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class User(UserBase):
@@ -268,13 +281,14 @@ class User(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
     """Authentication token model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     access_token: str
     token_type: str = "bearer"
 
@@ -282,5 +296,25 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     """JWT token payload model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     sub: Optional[str] = None
-    exp: Optional[int] = None 
\ No newline at end of file
+    exp: Optional[int] = None
+
+
+# Request-path models whose validators are built on first use, or ahead of
+# time by warm_up_models()
+DEFERRED_MODELS = (AnalysisRequest, Token, TokenPayload)
+
+
+def warm_up_models() -> None:
+    """
+    Build the validators of the deferred request-path models.
+    
+    Services that only need CrawlResult skip building these schemas at
+    import. Nothing calls this yet, so the first request that uses each
+    model builds it; an API service should call this from its startup hook
+    to move that cost off the request path.
+    """
+    for model in DEFERRED_MODELS:
+        model.model_rebuild()
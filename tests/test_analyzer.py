@@ -0,0 +1,206 @@
+"""Tests for the SEO analyzers."""
+
+import pytest
+
+from backend.seo_service import analyzer as analyzer_module
+from backend.seo_service.analyzer import KeywordAnalyzer, ReadabilityAnalyzer, SEOAnalyzer
+from backend.shared.models import CrawlResult
+
+
+PAGE = (
+    "<html><head><title>Cache test</title></head><body>"
+    "<h1>Heading</h1><p>Some text about caching. Another sentence here.</p>"
+    '<a href="/inner">inner</a><img src="/a.png">'
+    "</body></html>"
+)
+
+
+@pytest.fixture(params=["automaton", "str.count"])
+def scan_path(request, monkeypatch):
+    """Run a test with and without the Aho-Corasick scan."""
+    if request.param == "automaton":
+        if analyzer_module.ahocorasick is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(analyzer_module, "ahocorasick", None)
+    return request.param
+
+
+def _expected_scan(keyword_analyzer, keywords):
+    """What scanning with str.count and the in operator gives."""
+    return (
+        {keyword: keyword_analyzer.content.count(keyword) for keyword in keywords},
+        {keyword for keyword in keywords if keyword in keyword_analyzer.title},
+        {keyword for keyword in keywords if keyword in keyword_analyzer.meta_description}
+    )
+
+
+class TestScanKeywords:
+    """_scan_keywords matches str.count whichever scan it uses."""
+    
+    CASES = {
+        "overlapping": (
+            "banana bandana aaaa",
+            "ana nana",
+            "bananas",
+            ["ana", "nana", "aa", "an"]
+        ),
+        "substrings of each other": (
+            "seo tools for seo tool users",
+            "best seo tool",
+            "tools",
+            ["seo", "seo tool", "seo tools", "tool", "o"]
+        ),
+        "absent and repeated": (
+            "블로그 검색 최적화 블로그",
+            "블로그",
+            "",
+            ["블로그", "최적화", "없음", "블로그", "검색 최적화"]
+        ),
+        "empty keyword": (
+            "some content",
+            "title",
+            "meta",
+            ["", "some", "content", "title"]
+        ),
+    }
+    
+    @pytest.mark.parametrize("content, title, meta, keywords", CASES.values(), ids=CASES.keys())
+    def test_matches_str_count(self, scan_path, content, title, meta, keywords):
+        keyword_analyzer = KeywordAnalyzer(content, title, meta)
+        
+        assert keyword_analyzer._scan_keywords(keywords) == _expected_scan(keyword_analyzer, keywords)
+    
+    def test_empty_keyword_list(self, scan_path):
+        keyword_analyzer = KeywordAnalyzer("some content", "title", "meta")
+        
+        assert keyword_analyzer._scan_keywords([]) == ({}, set(), set())
+    
+    def test_case_is_folded(self, scan_path):
+        keyword_analyzer = KeywordAnalyzer(
+            "SEO Tools and seo tips for Blog SEO", "Blog SEO Guide", "Tips on SEO"
+        )
+        
+        targets = keyword_analyzer.analyze_keyword_density(["SEO", "Tips", "blog", "GUIDE"])["target_keywords"]
+        
+        assert {keyword: result["count"] for keyword, result in targets.items()} == {
+            "SEO": 3, "Tips": 1, "blog": 1, "GUIDE": 0
+        }
+        assert [keyword for keyword, result in targets.items() if result["in_title"]] == ["SEO", "blog", "GUIDE"]
+        assert [keyword for keyword, result in targets.items() if result["in_meta_description"]] == ["SEO", "Tips"]
+    
+    def test_no_target_keywords(self, scan_path):
+        keyword_analyzer = KeywordAnalyzer("some content", "title", "meta")
+        
+        assert keyword_analyzer.analyze_keyword_density([])["target_keywords"] == {}
+
+
+class TestReadability:
+    """The inline Flesch formulas stay close to what textstat reported."""
+    
+    # (text, textstat reading ease, textstat grade). textstat applies the same
+    # formulas with dictionary syllable counts; the regex estimate may differ
+    # on a few words, hence the tolerances
+    TEXTSTAT_SCORES = {
+        "monosyllabic": (
+            "The cat sat on the mat.",
+            116.15, -1.45
+        ),
+        "prose": (
+            "Search engines reward clear writing. "
+            "Readers stay longer on pages that answer their questions.",
+            66.79, 5.68
+        ),
+        "silent e": (
+            "I started this blog last year. Since then, I have written about "
+            "travel, food, and small things that make a day better. Thanks for reading!",
+            93.47, 2.29
+        ),
+        "polysyllabic": (
+            "Comprehensive documentation requires considerable organizational "
+            "coordination. Administrative responsibilities accumulate unexpectedly.",
+            -195.86, 41.82
+        ),
+    }
+    
+    @pytest.mark.parametrize(
+        "text, reading_ease, grade", TEXTSTAT_SCORES.values(), ids=TEXTSTAT_SCORES.keys()
+    )
+    def test_close_to_textstat(self, text, reading_ease, grade):
+        analysis = ReadabilityAnalyzer().analyze_readability(text)
+        
+        assert analysis["flesch_reading_ease"] == pytest.approx(reading_ease, abs=7)
+        assert analysis["flesch_kincaid_grade"] == pytest.approx(grade, abs=1)
+    
+    def test_empty_string(self):
+        assert ReadabilityAnalyzer().analyze_readability("") == {"error": "No content to analyze"}
+    
+    def test_whitespace_only(self):
+        analysis = ReadabilityAnalyzer().analyze_readability("  \n\n ")
+        
+        assert analysis["statistics"]["words"] == 0
+        assert analysis["statistics"]["sentences"] == 0
+    
+    def test_single_word(self):
+        analysis = ReadabilityAnalyzer().analyze_readability("word")
+        
+        # One word, one sentence, one syllable
+        assert analysis["flesch_reading_ease"] == 121.2
+        assert analysis["flesch_kincaid_grade"] == -3.4
+        assert analysis["statistics"]["sentences"] == 1
+    
+    @pytest.mark.parametrize("word, syllables", [
+        ("cat", 1), ("the", 1), ("make", 1), ("since", 1), ("people", 2),
+        ("table", 2), ("reading!", 2), ("Comprehensive", 4), ("블로그", 3), ("123", 1)
+    ])
+    def test_count_syllables(self, word, syllables):
+        assert ReadabilityAnalyzer._count_syllables(word) == syllables
+
+
+def _crawl_result(**overrides):
+    fields = {
+        "url": "https://example.com/post",
+        "success": True,
+        "title": "Cache test",
+        "content": PAGE,
+        "meta_description": "A page for testing the structural cache"
+    }
+    fields.update(overrides)
+    return CrawlResult(**fields)
+
+
+class TestStructuralCache:
+    """Cached structural analyses must not leak between calls."""
+    
+    SECTIONS = (
+        "meta_analysis", "heading_analysis", "link_analysis",
+        "readability_analysis", "technical_seo"
+    )
+    
+    @pytest.mark.parametrize("section", SECTIONS)
+    def test_mutating_a_result_leaves_the_cache_intact(self, section):
+        expected = SEOAnalyzer().analyze(_crawl_result())[section]
+        analyzer = SEOAnalyzer()
+        first = analyzer.analyze(_crawl_result(), ["cache"])
+        
+        first[section].clear()
+        second = analyzer.analyze(_crawl_result(), ["text"])
+        
+        assert second[section] == expected
+    
+    def test_nested_values_are_not_shared(self):
+        analyzer = SEOAnalyzer()
+        first = analyzer.analyze(_crawl_result())
+        second = analyzer.analyze(_crawl_result())
+        
+        assert first["technical_seo"] == second["technical_seo"]
+        for key, value in first["technical_seo"].items():
+            if isinstance(value, (dict, list)):
+                assert value is not second["technical_seo"][key]
+    
+    def test_changed_content_is_reanalyzed(self):
+        analyzer = SEOAnalyzer()
+        before = analyzer.analyze(_crawl_result())
+        after = analyzer.analyze(_crawl_result(content=PAGE.replace("<h1>Heading</h1>", "")))
+        
+        assert before["heading_analysis"] != after["heading_analysis"]
@@ -0,0 +1,49 @@
+"""Tests for settings loaded from the environment."""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.shared.config import Settings
+
+
+ORIGINS = ["http://localhost:3000/", "https://example.com/"]
+
+
+def _cors_origins(monkeypatch, value):
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", value)
+    settings = Settings(_env_file=None)
+    return [str(origin) for origin in settings.BACKEND_CORS_ORIGINS]
+
+
+class TestCorsOrigins:
+    """BACKEND_CORS_ORIGINS accepts a JSON array or a comma-separated list."""
+    
+    @pytest.mark.parametrize("value", [
+        "http://localhost:3000,https://example.com",
+        " http://localhost:3000 , https://example.com ,",
+    ])
+    def test_comma_separated(self, monkeypatch, value):
+        assert _cors_origins(monkeypatch, value) == ORIGINS
+    
+    @pytest.mark.parametrize("value", [
+        '["http://localhost:3000", "https://example.com"]',
+        '  ["http://localhost:3000","https://example.com"]',
+    ])
+    def test_json_array(self, monkeypatch, value):
+        assert _cors_origins(monkeypatch, value) == ORIGINS
+    
+    def test_single_origin(self, monkeypatch):
+        assert _cors_origins(monkeypatch, "https://example.com") == ORIGINS[1:]
+    
+    def test_empty(self, monkeypatch):
+        assert _cors_origins(monkeypatch, "") == []
+    
+    def test_unset(self, monkeypatch):
+        monkeypatch.delenv("BACKEND_CORS_ORIGINS", raising=False)
+        
+        assert Settings(_env_file=None).BACKEND_CORS_ORIGINS == []
+    
+    @pytest.mark.parametrize("value", ["not a url", '["not a url"]'])
+    def test_invalid_origin(self, monkeypatch, value):
+        with pytest.raises(ValidationError):
+            _cors_origins(monkeypatch, value)
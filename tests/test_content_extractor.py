@@ -0,0 +1,57 @@
+"""Tests for the BeautifulSoup content extractor."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from backend.crawling_service.crawler import HTML_PARSER, ContentExtractor
+from backend.shared.config import crawling_settings
+
+
+PLATFORMS = [None, *crawling_settings.PLATFORM_SELECTORS]
+
+URL = "https://blog.example.com/posts/1"
+
+# Class-only selectors hit a list item before the article
+LIST_ITEM_FIRST = """
+<html><head><title>Page</title></head><body>
+<ul><li class="post"><span>List post</span></li></ul>
+<ul><li class="author">Li author</li><li class="date">2024-01-02</li></ul>
+<article><h1>Article title</h1><p>Article body</p></article>
+</body></html>
+"""
+
+NESTED_CONTAINERS = """
+<html><head><title>Nested</title>
+<meta name="description" content="Desc"></head><body>
+<aside class="content"><p>Sidebar content</p></aside>
+<table><tr><td class="se-main-container entry-content wrap_body">Cell</td></tr></table>
+<div class="wrap_title"><h1>Brunch</h1></div>
+<div class="postArticle-content"><section><p>Medium</p></section></div>
+<a href="/about">About</a><img src="https://cdn.example.com/a.png">
+</body></html>
+"""
+
+
+class TestSelection:
+    """The first element in document order wins, whatever tag it is."""
+    
+    def test_class_only_selector_hits_list_item(self):
+        result = ContentExtractor(None).extract_html(LIST_ITEM_FIRST, URL)
+        
+        assert result["content"] == "List post"
+        assert result["author"] == "Li author"
+    
+    @pytest.mark.parametrize("platform", PLATFORMS)
+    @pytest.mark.parametrize("html", [LIST_ITEM_FIRST, NESTED_CONTAINERS])
+    def test_matches_css_select(self, platform, html):
+        extractor = ContentExtractor(platform)
+        soup = BeautifulSoup(html, HTML_PARSER)
+        
+        result = extractor.extract_content(soup, URL)
+        
+        for field in ("author", "content"):
+            elem = soup.select_one(extractor.selectors[field])
+            expected = elem.get_text(strip=True) if elem is not None else None
+            if field == "content" and elem is not None:
+                expected = extractor._get_content_text(elem)
+            assert result[field] == expected
@@ -0,0 +1,284 @@
+"""End-to-end tests for BlogCrawler against a local HTTP server."""
+
+import asyncio
+import gc
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from aiohttp import web
+
+from backend.crawling_service import crawler
+from backend.crawling_service.crawler import BlogCrawler
+
+
+KOREAN_PAGE = (
+    "<html><head><title>한국어 제목</title></head>"
+    "<body><article><p>본문 내용</p></article></body></html>"
+)
+
+
+@pytest.fixture
+async def blog_server():
+    async def utf8_without_meta(request):
+        return web.Response(
+            body=KOREAN_PAGE.encode("utf-8"),
+            headers={"Content-Type": "text/html; charset=utf-8"}
+        )
+    
+    async def euc_kr_header(request):
+        return web.Response(
+            body=KOREAN_PAGE.encode("euc-kr"),
+            headers={"Content-Type": "text/html; charset=euc-kr"}
+        )
+    
+    app = web.Application()
+    app.router.add_get("/utf8", utf8_without_meta)
+    app.router.add_get("/euc-kr", euc_kr_header)
+    
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    
+    yield f"http://{host}:{port}"
+    
+    await runner.cleanup()
+
+
+@pytest.mark.parametrize("path", ["/utf8", "/euc-kr"])
+async def test_crawl_url_decodes_korean_page(blog_server, path):
+    async with BlogCrawler() as blog_crawler:
+        result = await blog_crawler.crawl_url(blog_server + path)
+    
+    assert result.success, result.error_message
+    assert result.title == "한국어 제목"
+    assert result.content == "본문 내용"
+
+
+class BrokenPool(Executor):
+    """Executor whose workers have all died."""
+    
+    def __init__(self):
+        self.shut_down = False
+    
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+    
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+@pytest.fixture
+def parse_pool():
+    yield
+    crawler.shutdown_parse_pool()
+
+
+class TestParsePool:
+    """Parsing moves to the shared worker pool only for concurrent crawls."""
+    
+    @staticmethod
+    def _batch_crawler():
+        blog_crawler = BlogCrawler()
+        blog_crawler.rate_limiter.default_delay = 0
+        return blog_crawler
+    
+    async def test_single_crawl_parses_inline(self, blog_server, monkeypatch):
+        def no_pool():
+            raise AssertionError("a lone crawl must not start parser workers")
+        monkeypatch.setattr(crawler, "_get_parse_pool", no_pool)
+        
+        async with BlogCrawler() as blog_crawler:
+            result = await blog_crawler.crawl_url(blog_server + "/utf8")
+        
+        assert result.success, result.error_message
+        assert crawler._parse_pool is None
+    
+    async def test_batch_parses_in_shared_pool(self, blog_server, parse_pool):
+        urls = [blog_server + "/utf8", blog_server + "/euc-kr"] * 3
+        
+        async with self._batch_crawler() as first:
+            results = await first.crawl_multiple(urls)
+        pool = crawler._parse_pool
+        async with self._batch_crawler() as second:
+            await second.crawl_multiple(urls)
+        
+        assert [result.title for result in results] == ["한국어 제목"] * len(urls)
+        assert pool is not None
+        assert crawler._parse_pool is pool
+    
+    async def test_broken_pool_is_replaced(self, blog_server, parse_pool, monkeypatch):
+        broken = BrokenPool()
+        monkeypatch.setattr(crawler, "_parse_pool", broken)
+        urls = [blog_server + "/utf8"] * 3
+        
+        async with self._batch_crawler() as blog_crawler:
+            results = await blog_crawler.crawl_multiple(urls)
+        
+        assert all(result.title == "한국어 제목" for result in results)
+        assert broken.shut_down
+        assert crawler._parse_pool is not broken
+
+
+# Nothing listens on the discard port, so crawls fail fast without a network
+UNREACHABLE_URL = "http://127.0.0.1:9/post"
+
+
+@pytest.fixture
+def crawler_lifecycle(monkeypatch):
+    """Record every BlogCrawler that is opened and closed."""
+    opened, closed = [], []
+    enter, exit_ = BlogCrawler.__aenter__, BlogCrawler.__aexit__
+    
+    async def record_enter(self):
+        opened.append(self)
+        return await enter(self)
+    
+    async def record_exit(self, *exc_info):
+        closed.append(self)
+        return await exit_(self, *exc_info)
+    
+    monkeypatch.setattr(BlogCrawler, "__aenter__", record_enter)
+    monkeypatch.setattr(BlogCrawler, "__aexit__", record_exit)
+    yield opened, closed
+    asyncio.run(crawler.close_shared_crawler())
+
+
+class TestSharedCrawler:
+    """The convenience functions must not leak crawlers between event loops."""
+    
+    def test_sync_style_calls_close_their_crawler(self, crawler_lifecycle):
+        opened, closed = crawler_lifecycle
+        
+        for _ in range(2):
+            result = asyncio.run(crawler.crawl_blog_url(UNREACHABLE_URL))
+            assert not result.success
+        
+        assert len(opened) == 2
+        assert closed == opened
+        assert all(c.session.closed for c in opened)
+    
+    async def test_shared_crawler_reused_on_its_loop(self, crawler_lifecycle):
+        opened, closed = crawler_lifecycle
+        
+        shared = await crawler.get_shared_crawler()
+        await crawler.crawl_blog_url(UNREACHABLE_URL)
+        await crawler.crawl_blog_urls([UNREACHABLE_URL])
+        
+        assert opened == [shared]
+        assert closed == []
+        
+        await crawler.close_shared_crawler()
+        assert closed == [shared]
+        assert shared.session.closed
+    
+    async def test_concurrent_opens_share_one_crawler(self, crawler_lifecycle, monkeypatch):
+        opened, _ = crawler_lifecycle
+        record_enter = BlogCrawler.__aenter__
+        
+        async def slow_enter(self):
+            await asyncio.sleep(0.01)
+            return await record_enter(self)
+        
+        monkeypatch.setattr(BlogCrawler, "__aenter__", slow_enter)
+        
+        crawlers = await asyncio.gather(*(crawler.get_shared_crawler() for _ in range(5)))
+        
+        assert len(opened) == 1
+        assert all(c is opened[0] for c in crawlers)
+        await crawler.close_shared_crawler()
+    
+    # The stale crawler's session belongs to a closed loop and cannot be closed
+    @pytest.mark.filterwarnings("ignore:Unclosed:ResourceWarning")
+    def test_stale_shared_crawler_is_released(self, crawler_lifecycle, caplog):
+        opened, closed = crawler_lifecycle
+        
+        stale = asyncio.run(crawler.get_shared_crawler())
+        asyncio.run(crawler.crawl_blog_url(UNREACHABLE_URL))
+        
+        assert "close_shared_crawler()" in caplog.text
+        assert crawler._shared_crawler is None
+        assert closed == opened[1:]
+        
+        del stale
+        opened.clear()
+        gc.collect()
+
+
+class FakeContext:
+    """Stands in for a Playwright BrowserContext."""
+    
+    def __init__(self):
+        self.closed = False
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Creates FakeContexts, failing the calls listed in fail_on."""
+    
+    def __init__(self, fail_on=()):
+        self.created = 0
+        self.fail_on = set(fail_on)
+    
+    async def new_context(self, **kwargs):
+        self.created += 1
+        if self.created in self.fail_on:
+            raise RuntimeError("browser crashed")
+        return FakeContext()
+
+
+async def _filled_crawler(browser, slots=2):
+    blog_crawler = BlogCrawler()
+    blog_crawler._browser = browser
+    for _ in range(slots):
+        blog_crawler._context_pool.put_nowait(await blog_crawler._new_context())
+    return blog_crawler
+
+
+class TestBrowserContextPool:
+    """Browser contexts must not carry state from one crawl to the next."""
+    
+    async def test_context_is_not_reused(self):
+        blog_crawler = await _filled_crawler(FakeBrowser(), slots=1)
+        
+        async with blog_crawler._browser_context() as first:
+            pass
+        async with blog_crawler._browser_context() as second:
+            pass
+        
+        assert first is not second
+        assert first.closed
+        assert blog_crawler._context_pool.qsize() == 1
+    
+    async def test_failed_replacement_keeps_slot(self):
+        # Contexts 1-2 fill the pool, creating replacement 3 fails
+        blog_crawler = await _filled_crawler(FakeBrowser(fail_on={3}))
+        
+        async with blog_crawler._browser_context():
+            pass
+        
+        pool = blog_crawler._context_pool
+        untouched, empty = pool.get_nowait(), pool.get_nowait()
+        assert isinstance(untouched, FakeContext) and empty is None
+        
+        # The empty slot is refilled by whoever borrows it next
+        pool.put_nowait(empty)
+        pool.put_nowait(untouched)
+        async with blog_crawler._browser_context() as context:
+            assert isinstance(context, FakeContext) and context is not untouched
+    
+    async def test_failed_creation_on_borrow_keeps_slot(self):
+        # Context 1 fills the pool, replacement 2 and creation 3 fail
+        blog_crawler = await _filled_crawler(FakeBrowser(fail_on={2, 3}), slots=1)
+        
+        async with blog_crawler._browser_context():
+            pass
+        with pytest.raises(RuntimeError):
+            async with blog_crawler._browser_context():
+                pass
+        
+        assert blog_crawler._context_pool.get_nowait() is None
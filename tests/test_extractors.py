@@ -0,0 +1,268 @@
+"""Tests shared by the BeautifulSoup, lexbor and streaming content extractors."""
+
+import pytest
+
+from backend.crawling_service.crawler import (
+    ContentExtractor,
+    ContentExtractorFast,
+    ContentExtractorStream,
+    LexborHTMLParser,
+    decode_markup,
+    etree,
+)
+
+
+URL = "https://blog.example.com/posts/1"
+
+EXTRACTORS = [
+    pytest.param(ContentExtractor, id="soup"),
+    pytest.param(
+        ContentExtractorStream, id="stream",
+        marks=pytest.mark.skipif(etree is None, reason="lxml not installed")
+    ),
+    pytest.param(
+        ContentExtractorFast, id="lexbor",
+        marks=pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed")
+    ),
+]
+
+KOREAN_PAGE = """<html><head>{meta}<title>한국어 제목</title></head>
+<body><article class="entry-content"><p>본문 내용</p></article></body></html>"""
+
+
+def _extractor(extractor_class):
+    # The lexbor path only serves known platforms
+    return extractor_class("tistory" if extractor_class is ContentExtractorFast else None)
+
+
+class TestEncoding:
+    """Page bytes must decode the same way whichever parser reads them."""
+    
+    @pytest.mark.parametrize("extractor_class", EXTRACTORS)
+    @pytest.mark.parametrize("encoding, meta", [
+        ("utf-8", ""),
+        ("utf-8-sig", ""),
+        ("utf-16", ""),
+        ("euc-kr", ""),
+        ("euc-kr", '<meta charset="euc-kr">'),
+        ("utf-8", '<meta http-equiv="Content-Type" content="text/html; charset=utf-8">'),
+    ])
+    def test_korean_bytes(self, extractor_class, encoding, meta):
+        html = KOREAN_PAGE.format(meta=meta).encode(encoding)
+        
+        result = _extractor(extractor_class).extract_html(html, URL)
+        
+        assert result["title"] == "한국어 제목"
+        assert result["content"] == "본문 내용"
+    
+    @pytest.mark.parametrize("extractor_class", EXTRACTORS)
+    @pytest.mark.parametrize("padding", [900, 1200, 1900])
+    def test_late_charset_declaration(self, extractor_class, padding):
+        # lexbor stops looking for <meta charset> after 1024 bytes
+        script = "<script>" + "x" * padding + "</script>"
+        html = KOREAN_PAGE.format(meta=script + '<meta charset="euc-kr">').encode("euc-kr")
+        
+        result = _extractor(extractor_class).extract_html(html, URL)
+        
+        assert result["title"] == "한국어 제목"
+        assert result["content"] == "본문 내용"
+    
+    @pytest.mark.parametrize("extractor_class", EXTRACTORS)
+    def test_korean_text(self, extractor_class):
+        result = _extractor(extractor_class).extract_html(KOREAN_PAGE.format(meta=""), URL)
+        
+        assert result["title"] == "한국어 제목"
+
+
+# Classes and nesting that every platform's selectors (and the defaults) hit
+PAGE_TEMPLATE = """<html><head>{meta}<title>Page title</title>
+<meta name="description" content="Page description">
+<meta name="keywords" content="seo, blog">
+<script>var html = "<article class='content'>not content</article>";</script>
+<style>.entry-content { color: red; }</style>
+</head><body>
+<nav><a href="/">Home</a><a href="https://other.example.com/">Other</a></nav>
+<div class="wrap_title"><h1 class="entry-title se-title-text">Post title<style>h1 { }</style><template>Draft</template></h1></div>
+<span class="nick author by_author"> Writer <script>track("author")</script></span>
+<time class="se-date article-date entry-date wrap_date" datetime="2024-05-06T07:08:09">May 6</time>
+<article class="se-main-container entry-content postArticle-content wrap_body content">
+{body}
+</article>
+<footer><a href="/footer">Footer</a><img src="/logo.png"></footer>
+</body></html>"""
+
+BODIES = {
+    "plain": "<p>First paragraph with <a href='/first'>a link</a>.</p><p>Second</p>"
+             "<img src='/img/1.png'><img src='https://cdn.example.com/2.png'><img src='/img/1.png'>",
+    "skip_tags": "<p>Before</p><script>skip()</script><style>p {}</style>"
+                 "<nav><p>Nav <footer>nested</footer></p></nav><footer><p>Foot</p></footer>"
+                 "<div>Kept <!-- comment --> text</div><p>After</p>",
+    "noscript_template": "<template><p>Template text</p></template>"
+                         "<noscript><p>Enable JavaScript</p></noscript><p>Visible</p>",
+    "unclosed": "<p>One<p>Two <b>bold<div>Three</div><li>Item",
+    "korean": "<p>한국어 본문입니다.</p><p>두 번째 문단</p>",
+}
+
+# Misnested formatting tags and stray table content
+MISNESTED_BODY = (
+    "<p>One <b>bold <i>both</b> italic</i> tail<p>Two"
+    "<table><tr><td>cell</td><p>in table</p></tr></table><p>End"
+)
+
+INPUT_FORMS = {
+    "str": lambda page: page.replace("{meta}", ""),
+    "utf8-bytes": lambda page: page.replace("{meta}", "").encode("utf-8"),
+    "utf8-bytes-declared": (
+        lambda page: page.replace("{meta}", '<meta charset="utf-8">').encode("utf-8")
+    ),
+    "euckr-bytes-declared": (
+        lambda page: page.replace("{meta}", '<meta charset="euc-kr">').encode("euc-kr")
+    ),
+}
+
+PLATFORMS = [None, "naver", "tistory", "wordpress", "medium", "brunch"]
+
+
+def _page(body: str) -> str:
+    return PAGE_TEMPLATE.replace("{body}", body)
+
+
+def _text_page(body: str) -> str:
+    return _page(body).replace("{meta}", "")
+
+
+class TestEquivalence:
+    """Every extractor returns what the BeautifulSoup extractor returns."""
+    
+    @pytest.mark.parametrize("extractor_class", EXTRACTORS[1:])
+    @pytest.mark.parametrize("platform", PLATFORMS)
+    @pytest.mark.parametrize("body", BODIES.values(), ids=BODIES.keys())
+    @pytest.mark.parametrize("form", INPUT_FORMS.values(), ids=INPUT_FORMS.keys())
+    def test_matches_soup(self, extractor_class, platform, body, form):
+        html = form(_page(body))
+        
+        expected = ContentExtractor(platform).extract_html(html, URL)
+        
+        assert extractor_class(platform).extract_html(html, URL) == expected
+    
+    @pytest.mark.parametrize("extractor_class, platform", [
+        pytest.param(ContentExtractorStream, platform, id=f"stream-{platform}",
+                     marks=pytest.mark.skipif(etree is None, reason="lxml not installed"))
+        for platform in (None, "naver", "wordpress")
+    ] + [
+        pytest.param(ContentExtractorFast, platform, id=f"lexbor-{platform}",
+                     marks=pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed"))
+        for platform in PLATFORMS[1:]
+    ])
+    @pytest.mark.parametrize("body", BODIES.values(), ids=BODIES.keys())
+    @pytest.mark.parametrize("form", INPUT_FORMS.values(), ids=INPUT_FORMS.keys())
+    def test_does_not_fall_back(self, monkeypatch, extractor_class, platform, body, form):
+        def fall_back(self, html, url):
+            raise AssertionError("fell back to the BeautifulSoup extractor")
+        
+        extractor = extractor_class(platform)
+        monkeypatch.setattr(ContentExtractor, "extract_html", fall_back)
+        
+        extractor.extract_html(form(_page(body)), URL)
+    
+    @pytest.mark.parametrize("extractor_class", EXTRACTORS)
+    @pytest.mark.parametrize("platform", PLATFORMS[1:])
+    def test_inline_script_in_date_text(self, extractor_class, platform):
+        html = _text_page("").replace(
+            '<time class="se-date article-date entry-date wrap_date" datetime="2024-05-06T07:08:09">May 6</time>',
+            '<span class="se-date article-date entry-date wrap_date date">2024. 5. 6.<script>1</script></span>'
+        )
+        
+        result = extractor_class(platform).extract_html(html, URL)
+        
+        assert result["published_date"].isoformat() == "2024-05-06T00:00:00"
+        assert result["author"] == "Writer"
+    
+    @pytest.mark.parametrize("platform", PLATFORMS)
+    def test_fields(self, platform):
+        result = ContentExtractor(platform).extract_html(_text_page(BODIES["plain"]), URL)
+        
+        # The default "h1, title" hits <title> first, in document order
+        assert result["title"] == ("Page title" if platform is None else "Post title")
+        assert result["content"] == "First paragraph with\na link\n.\nSecond"
+        assert result["meta_description"] == "Page description"
+        assert result["meta_keywords"] == "seo, blog"
+        assert result["author"] == "Writer"
+        assert result["published_date"].isoformat() == "2024-05-06T07:08:09"
+        assert result["links"] == (
+            "https://blog.example.com/",
+            "https://other.example.com/",
+            "https://blog.example.com/first",
+            "https://blog.example.com/footer"
+        )
+        assert result["images"] == (
+            "https://blog.example.com/img/1.png",
+            "https://cdn.example.com/2.png",
+            "https://blog.example.com/logo.png"
+        )
+    
+    @pytest.mark.parametrize("platform", PLATFORMS)
+    def test_skipped_text(self, platform):
+        skip = ContentExtractor(platform).extract_html(_text_page(BODIES["skip_tags"]), URL)
+        hidden = ContentExtractor(platform).extract_html(_text_page(BODIES["noscript_template"]), URL)
+        
+        assert skip["content"] == "Before\nKept\ntext\nAfter"
+        assert hidden["content"] == "Enable JavaScript\nVisible"
+
+
+class TestMisnestedMarkup:
+    """
+    lxml repairs misnested markup differently from the HTML5 tree builder.
+    
+    The BeautifulSoup and streaming extractors both parse with libxml2 and
+    must agree; lexbor builds the tree a browser would, which can split or
+    reorder the content text.
+    """
+    
+    @pytest.mark.skipif(etree is None, reason="lxml not installed")
+    @pytest.mark.parametrize("platform", PLATFORMS)
+    @pytest.mark.parametrize("form", INPUT_FORMS.values(), ids=INPUT_FORMS.keys())
+    def test_stream_matches_soup(self, platform, form):
+        html = form(_page(MISNESTED_BODY))
+        
+        expected = ContentExtractor(platform).extract_html(html, URL)
+        
+        assert ContentExtractorStream(platform).extract_html(html, URL) == expected
+    
+    @pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed")
+    def test_lexbor_builds_html5_tree(self):
+        html = _text_page(MISNESTED_BODY)
+        
+        soup = ContentExtractor("tistory").extract_html(html, URL)
+        fast = ContentExtractorFast("tistory").extract_html(html, URL)
+        
+        assert soup["content"] == "One\nbold\nboth\nitalic tail\nTwo\ncell\nin table\nEnd"
+        assert fast["content"] == "One\nbold\nboth\nitalic\ntail\nTwo\nin table\ncell\nEnd"
+        assert {**fast, "content": None} == {**soup, "content": None}
+
+
+class TestDecodeMarkup:
+    """Bytes are decoded at most once, and only when the parser cannot."""
+    
+    def test_undeclared_utf8_is_decoded(self):
+        html = KOREAN_PAGE.format(meta="")
+        
+        assert decode_markup(html.encode("utf-8")) == html
+    
+    @pytest.mark.parametrize("html", [
+        b"<html><title>ascii</title></html>",
+        KOREAN_PAGE.format(meta='<meta charset="euc-kr">').encode("euc-kr"),
+        KOREAN_PAGE.format(meta="").encode("utf-8-sig"),
+    ])
+    def test_parser_readable_bytes_pass_through(self, html):
+        assert decode_markup(html) is html
+    
+    def test_declaration_outside_window_is_decoded(self):
+        html = KOREAN_PAGE.format(meta="<!--" + "x" * 1100 + '--><meta charset="euc-kr">')
+        
+        assert decode_markup(html.encode("euc-kr"), 1024) == html
+    
+    def test_undeclared_legacy_encoding_is_guessed(self):
+        html = KOREAN_PAGE.format(meta="")
+        
+        assert decode_markup(html.encode("euc-kr")) == html
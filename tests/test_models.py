@@ -0,0 +1,94 @@
+"""Tests for the shared data models."""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.shared.models import (
+    AnalysisRequest,
+    BlogPostCreate,
+    CrawlResult,
+    NLPAnalysisBase,
+    SEOAnalysisBase,
+)
+
+
+class TestScoreBounds:
+    """Scores outside their range are rejected."""
+    
+    @pytest.mark.parametrize("score", [0, 55, 100, None])
+    def test_overall_score_accepted(self, score):
+        assert SEOAnalysisBase(overall_score=score).overall_score == score
+    
+    @pytest.mark.parametrize("score", [-1, 101])
+    def test_overall_score_rejected(self, score):
+        with pytest.raises(ValidationError) as excinfo:
+            SEOAnalysisBase(overall_score=score)
+        
+        assert excinfo.value.errors()[0]["loc"] == ("overall_score",)
+    
+    @pytest.mark.parametrize("score", [-1.0, 0.0, 0.25, 1.0, None])
+    def test_sentiment_score_accepted(self, score):
+        assert NLPAnalysisBase(sentiment_score=score).sentiment_score == score
+    
+    @pytest.mark.parametrize("score", [-1.01, 1.5])
+    def test_sentiment_score_rejected(self, score):
+        with pytest.raises(ValidationError) as excinfo:
+            NLPAnalysisBase(sentiment_score=score)
+        
+        assert excinfo.value.errors()[0]["loc"] == ("sentiment_score",)
+
+
+class TestAnalysisRequest:
+    """Only known analysis types may be requested."""
+    
+    def test_defaults(self):
+        request = AnalysisRequest(url="https://example.com/post")
+        
+        assert request.analysis_types == ["seo", "nlp"]
+    
+    def test_valid_types(self):
+        request = AnalysisRequest(url="https://example.com/post", analysis_types=["all", "competition"])
+        
+        assert request.analysis_types == ["all", "competition"]
+    
+    def test_invalid_type_rejected(self):
+        with pytest.raises(ValidationError, match=r"Invalid analysis types: \['backlinks'\]"):
+            AnalysisRequest(url="https://example.com/post", analysis_types=["seo", "backlinks"])
+
+
+class TestFromCrawlResult:
+    """BlogPostCreate reads the slotted CrawlResult directly."""
+    
+    def test_fields_copied(self):
+        crawl_result = CrawlResult(
+            url="https://blog.example.com/post",
+            success=True,
+            status_code=200,
+            title="Title",
+            content="Body",
+            meta_description="Description",
+            author="Author",
+            platform="tistory",
+            links=("https://blog.example.com/a", "https://example.org/b"),
+            images=("https://blog.example.com/a.png",),
+            response_time=0.5
+        )
+        
+        post = BlogPostCreate.from_crawl_result(crawl_result)
+        
+        assert str(post.url) == "https://blog.example.com/post"
+        assert (post.title, post.content, post.meta_description) == ("Title", "Body", "Description")
+        assert (post.author, post.platform) == ("Author", "tistory")
+        assert post.language == "ko"
+    
+    def test_minimal_result(self):
+        post = BlogPostCreate.from_crawl_result(
+            CrawlResult(url="https://blog.example.com/post", success=True, links=(), images=())
+        )
+        
+        assert post.title is None
+        assert post.content is None
+    
+    def test_invalid_url_rejected(self):
+        with pytest.raises(ValidationError):
+            BlogPostCreate.from_crawl_result(CrawlResult(url="not a url", success=True))
@@ -0,0 +1,91 @@
+"""Tests for resolving links against the page URL."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from backend.crawling_service import crawler
+from backend.crawling_service.crawler import ContentExtractor, resolve_url
+
+
+BASE = "https://blog.example.com/posts/1?x=1#top"
+
+# Hrefs that ada-url and urljoin resolve the same way
+MATCHING_HREFS = [
+    "/about",
+    "/a/../b",
+    "/%zz",
+    "//cdn.example.com/a.png",
+    "#frag",
+    "?q=2",
+    "../up",
+    "javascript:void(0)",
+    "mailto:editor@example.com",
+    "https://other.example.com/p",
+]
+
+# ada-url follows the WHATWG URL standard, as browsers do, where urljoin
+# keeps the href as written
+WHATWG_HREFS = [
+    ("//cdn.example.com", "https://cdn.example.com/"),
+    ("/a b", "https://blog.example.com/a%20b"),
+    ("/한글", "https://blog.example.com/%ED%95%9C%EA%B8%80"),
+    ("/\\x", "https://x/"),
+    ("", "https://blog.example.com/posts/1?x=1"),
+]
+
+# Hrefs ada-url rejects, resolved by the urljoin fallback
+MALFORMED_HREFS = ["//", "https://example.com:99999/"]
+
+
+@pytest.fixture
+def without_ada(monkeypatch):
+    monkeypatch.setattr(crawler, "join_url", None)
+
+
+needs_ada = pytest.mark.skipif(crawler.join_url is None, reason="ada-url not installed")
+
+
+@needs_ada
+class TestAdaPath:
+    """resolve_url with ada-url installed."""
+    
+    @pytest.mark.parametrize("href", MATCHING_HREFS)
+    def test_matches_urljoin(self, href):
+        assert resolve_url(BASE, href) == urljoin(BASE, href)
+    
+    @pytest.mark.parametrize("href, expected", WHATWG_HREFS)
+    def test_normalizes_like_browsers(self, href, expected):
+        assert resolve_url(BASE, href) == expected
+    
+    @pytest.mark.parametrize("href", MALFORMED_HREFS)
+    def test_falls_back_to_urljoin(self, href):
+        assert resolve_url(BASE, href) == urljoin(BASE, href)
+    
+    def test_invalid_base_falls_back_to_urljoin(self):
+        assert resolve_url("not a url", "/x") == urljoin("not a url", "/x")
+    
+    def test_unparseable_href_raises(self):
+        with pytest.raises(ValueError):
+            resolve_url(BASE, "//[bad")
+
+
+@pytest.mark.usefixtures("without_ada")
+class TestUrljoinFallback:
+    """resolve_url without ada-url."""
+    
+    @pytest.mark.parametrize(
+        "href", MATCHING_HREFS + [href for href, _ in WHATWG_HREFS] + MALFORMED_HREFS
+    )
+    def test_uses_urljoin(self, href):
+        assert resolve_url(BASE, href) == urljoin(BASE, href)
+
+
+def test_extractor_skips_unparseable_links():
+    extractor = ContentExtractor(None)
+    
+    links: dict = {}
+    for href in ("//[bad", "/ok"):
+        extractor._add_url(links, href, BASE)
+    
+    assert tuple(links) == ("https://blog.example.com/ok",)